@@ -0,0 +1 @@
+"""Micro-C Analyzer Benchmarks"""
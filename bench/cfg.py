@@ -0,0 +1,40 @@
+"""Program Graph Construction Benchmark
+
+Usage: python -m bench.cfg [--sizes N [N ...]]
+"""
+
+import argparse
+import timeit
+
+from lang.types import *
+from passes.parse import parse
+from passes.cfg import UCProgramGraph
+
+from . import programs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[1250, 2500, 5000, 10000])
+
+    args = parser.parse_args()
+
+    print(f'{"statements":>12}{"nodes":>10}{"time (s)":>12}{"us/stmt":>10}')
+
+    # Parse the largest program once and build the others from its prefixes
+    block = parse(programs.loops(2 * max(args.sizes))).blocks[0]
+
+    for n in args.sizes:
+        ast = UCProgram([UCBlock(block.decls,
+                                 UCStatements(block.stmts.stmts[:n]))])
+
+        t = timeit.default_timer()
+        cfg = UCProgramGraph().compute(ast)
+        t = timeit.default_timer() - t
+
+        print(f'{n:>12}{len(cfg.nodes):>10}{t:>12.3f}{t / n * 1e6:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
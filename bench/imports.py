@@ -0,0 +1,88 @@
+"""Import-time Benchmark
+
+Usage: python -m bench.imports [--runs K]
+
+Measures the cumulative `python -X importtime` cost of the analyzer modules
+in fresh interpreters, and reports whether networkx or ply were pulled in.
+Import times depend on the machine, so they are reported next to the cost
+of importing networkx on the same machine, and only a light module pulling
+in networkx or ply is a failure.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+
+# Modules which must not import the heavy packages
+LIGHT = ('passes.parse', 'passes.analysis', 'passes.report', 'main')
+
+# Modules which import them, measured against the cost of the import
+BASELINES = {
+    'passes.cfg': 'networkx',
+}
+
+HEAVY = ('networkx', 'ply')
+
+
+def importtime(module):
+    """Cumulative import time (ms) of `module` and the heavy packages it
+    imported"""
+    p = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                        f'import {module}'],
+                       check=True, capture_output=True, text=True)
+    t = None
+    heavy = set()
+
+    for line in p.stderr.splitlines():
+        _, _, cumulative, name = [f.strip() for f in
+                                  line.replace(':', '|', 1).split('|')]
+
+        if name == module:
+            t = int(cumulative) / 1e3
+
+        if name in HEAVY:
+            heavy.add(name)
+
+    return t, heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+
+    args = parser.parse_args()
+
+    def median_importtime(module):
+        ts, heavy = [], set()
+
+        for _ in range(args.runs):
+            t, heavy = importtime(module)
+            ts.append(t)
+
+        return statistics.median(ts), heavy
+
+    failed = 0
+
+    for module in LIGHT:
+        t, heavy = median_importtime(module)
+        status = 'ok' if not heavy else 'FAIL'
+        failed += len(heavy) > 0
+
+        print(f'{module:16} {t:8.1f} ms  ({status})'
+              f'  imports: {", ".join(sorted(heavy)) or "-"}')
+
+    for module, baseline in BASELINES.items():
+        t, heavy = median_importtime(module)
+        t_baseline, _ = median_importtime(baseline)
+
+        print(f'{module:16} {t:8.1f} ms  ({t - t_baseline:+.1f} ms over '
+              f'{baseline}, {t_baseline:.1f} ms)'
+              f'  imports: {", ".join(sorted(heavy)) or "-"}')
+
+    sys.exit(1 if failed > 0 else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Parser Cold-start Benchmark
+
+Usage: python -m bench.parse [--src-file FILE] [--runs K]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import timeit
+
+import ply.yacc as yacc
+
+import passes.parse
+
+
+COLD_START = '''
+from passes.parse import parse
+with open({src_file!r}) as f:
+    parse(f.read())
+'''
+
+REGENERATE = '''
+import ply.yacc as yacc
+import passes.parse
+yacc.yacc(module=passes.parse, tabmodule='parsetab_missing',
+          debug=False, write_tables=False)
+'''
+
+
+def run(code, runs):
+    ts = []
+
+    for _ in range(runs):
+        t = timeit.default_timer()
+        subprocess.run([sys.executable, '-c', code], check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        ts.append(timeit.default_timer() - t)
+
+    return statistics.median(ts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--src-file', dest='src_file', default='test/test.uc')
+    parser.add_argument('--runs', type=int, default=10)
+
+    args = parser.parse_args()
+
+    t_python = run('pass', args.runs)
+    t_cold = run(COLD_START.format(src_file=args.src_file), args.runs)
+    t_regen = run(REGENERATE, args.runs)
+
+    # Per-call cost of getting a parser, before and after the singleton
+    passes.parse.get_parser()
+
+    t_singleton = timeit.timeit(passes.parse.get_parser, number=1000) / 1000
+    t_yacc = timeit.timeit(
+        lambda: yacc.yacc(module=passes.parse, tabmodule='parsetab',
+                          debug=False, write_tables=False), number=20) / 20
+
+    print(f'interpreter startup:          {t_python * 1e3:8.1f} ms')
+    print(f'import + parse (prebuilt):    {(t_cold - t_python) * 1e3:8.1f} ms')
+    print(f'import + table generation:    {(t_regen - t_python) * 1e3:8.1f} ms')
+    print(f'parser per call (singleton):  {t_singleton * 1e3:8.4f} ms')
+    print(f'parser per call (yacc.yacc):  {t_yacc * 1e3:8.4f} ms')
+
+
+if __name__ == '__main__':
+    main()
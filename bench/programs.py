@@ -0,0 +1,84 @@
+"""Synthetic Micro-C Program Generation"""
+
+import random
+
+
+def straight_line(n, n_vars=10, seed=0):
+    """Program made of `n` assignments and no branches"""
+    rng = random.Random(seed)
+    vars = [f'v{i}' for i in range(n_vars)]
+
+    lines = ['{'] + [f'    int {x};' for x in vars]
+
+    for _ in range(n):
+        x, y, z = rng.sample(vars, 3)
+        lines.append(f'    {x} := {y} + {z};')
+
+    lines.append('}')
+
+    return '\n'.join(lines)
+
+
+def loops(n, n_vars=10, loop_ratio=0.1, seed=0):
+    """Program made of `n` statements, a fraction of which are loops"""
+    rng = random.Random(seed)
+    vars = [f'v{i}' for i in range(n_vars)]
+
+    lines = ['{'] + [f'    int {x};' for x in vars]
+    k = 0
+
+    while k < n:
+        if rng.random() < loop_ratio:
+            x, y = rng.sample(vars, 2)
+            lines.append(f'    while ({x} < {y}) {{')
+            lines.append(f'        {x} := {x} + 1;')
+            lines.append(f'        {y} := {y} - {x};')
+            lines.append('    }')
+            k += 3
+        else:
+            x, y, z = rng.sample(vars, 3)
+            lines.append(f'    {x} := {y} * {z};')
+            k += 1
+
+    lines.append('}')
+
+    return '\n'.join(lines)
+
+
+def nested(depth, n_vars=4, seed=0):
+    """Program made of `depth` nested while/if statements"""
+    rng = random.Random(seed)
+    vars = [f'v{i}' for i in range(n_vars)]
+
+    lines = ['{'] + [f'    int {x};' for x in vars]
+
+    for i in range(depth):
+        x, y = rng.sample(vars, 2)
+        lines.append(f'{"while" if i % 2 == 0 else "if"} ({x} < {y}) {{')
+        lines.append(f'{x} := {x} + 1;')
+
+    lines.extend(['}'] * depth)
+    lines.append('}')
+
+    return '\n'.join(lines)
+
+
+def unknown_signs(n_vars, n_guards=4, seed=0):
+    """Program whose `n_vars` variables may have any sign, followed by
+    `n_guards` conditionals on pairs of them"""
+    rng = random.Random(seed)
+    vars = [f'v{i}' for i in range(n_vars)]
+
+    lines = ['{', '    int p;', '    int m;'] + [f'    int {x};' for x in vars]
+    lines.extend(['    p := 1;', '    m := 0 - 1;'])
+    lines.extend(f'    {x} := p + m;' for x in vars)
+
+    for _ in range(n_guards):
+        x, y = rng.sample(vars, 2)
+        lines.append(f'    if ({x} < {y}) {{')
+        lines.append(f'        {x} := {y};')
+        lines.append('    }')
+
+    lines.append('}')
+
+    return '\n'.join(lines)
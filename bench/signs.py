@@ -0,0 +1,54 @@
+"""Detection of Signs Guard Refinement Benchmark
+
+Usage: python -m bench.signs [--vars N [N ...]] [--guards K]
+"""
+
+import argparse
+import timeit
+
+from passes.parse import parse
+from passes.cfg import UCProgramGraph
+from passes.analysis import UCDetectionSigns
+
+from . import programs
+
+
+def ds_time(cfg, split_all=False):
+    ds = UCDetectionSigns(cfg)
+
+    # Split on every scalar variable, as before the refinement
+    if split_all:
+        ds.guard_vars = lambda a: None
+
+    t = timeit.default_timer()
+    ds.compute()
+
+    return timeit.default_timer() - t, ds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--vars', type=int, nargs='+', default=[4, 6, 8])
+    parser.add_argument('--guards', type=int, default=4)
+
+    args = parser.parse_args()
+
+    print(f'{"variables":>10}{"guard vars (ms)":>18}{"all vars (ms)":>16}'
+          f'{"memo hits":>14}')
+
+    for n in args.vars:
+        src = programs.unknown_signs(n, args.guards)
+        cfg = UCProgramGraph().compute(parse(src))
+
+        t, ds = ds_time(cfg)
+        t_all, ds_all = ds_time(cfg, split_all=True)
+
+        assert ds.aa == ds_all.aa
+
+        hits = f'{ds.memo_hits}/{ds.memo_hits + ds.memo_misses}'
+
+        print(f'{n:>10}{t * 1e3:>18.1f}{t_all * 1e3:>16.1f}{hits:>14}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""Worklist Emptiness Test and Solver Micro-benchmark
+
+Usage: python -m bench.worklist [--size N] [--repeat K]
+"""
+
+import argparse
+import timeit
+
+from passes.parse import parse
+from passes.cfg import UCProgramGraph
+from passes.analysis import UCReachingDefs
+from passes.internal.worklist import *
+
+from . import programs
+
+
+def legacy_empty(ucw):
+    """Emptiness test as performed before, by comparing against a freshly
+    constructed empty worklist"""
+    return ucw == UCWorklist(UCProgramGraph.empty,
+                             lambda _: set(), dict(), ucw.strategy_type)
+
+
+def rd_worklist(cfg, strategy, solver=UCWorklist):
+    rd = UCReachingDefs(cfg)
+    rd.compute_masks()
+
+    r = {q: 0 for q in cfg.nodes}
+    r[cfg.source] = (1 << len(cfg.vars)) - 1
+
+    if solver.frozen:
+        g = cfg.freeze()
+
+        return solver(g, rd.domain(g), [r[q] for q in g.labels],
+                      strategy=strategy)
+
+    return solver(cfg, rd.domain(), r, strategy=strategy)
+
+
+def solve_time(cfg, strategy, solver=UCWorklist):
+    """Time per iteration (us) of the RD solution"""
+    ucw = rd_worklist(cfg, strategy, solver)
+
+    t = timeit.default_timer()
+    iters = ucw.compute()
+    t = timeit.default_timer() - t
+
+    return t / iters * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=10000)
+
+    args = parser.parse_args()
+
+    cfg = UCProgramGraph().compute(parse(programs.loops(args.size)))
+
+    print(f'{len(cfg.nodes)} nodes, {len(cfg.edges)} edges\n')
+    print(f'{"strategy":<20}{"empty (ns)":>12}{"legacy (ns)":>14}'
+          f'{"solve (us/iter)":>18}{"frozen (us/iter)":>18}')
+
+    for strategy in (UCFIFOStrategy, UCLIFOStrategy, UCRRStrategy,
+                     UCPriorityStrategy):
+        ucw = rd_worklist(cfg, strategy)
+
+        t_empty = timeit.timeit(lambda: ucw.empty, number=args.repeat)
+        t_legacy = timeit.timeit(lambda: legacy_empty(ucw), number=args.repeat)
+
+        print(f'{strategy.__name__:<20}'
+              f'{t_empty / args.repeat * 1e9:>12.0f}'
+              f'{t_legacy / args.repeat * 1e9:>14.0f}'
+              f'{solve_time(cfg, strategy):>18.2f}'
+              f'{solve_time(cfg, strategy, UCFrozenWorklist):>18.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,4 @@
 """Abstract Syntax Tree for Micro-C"""
-import inspect
-
 from functools import reduce
 
 
@@ -31,26 +29,28 @@ class UCASTNode:
 
         return False
 
-    def __str__(self):
-        def str_aux(root, depth=0):
-            if root == None:
-                return ''
+    def walk(self):
+        """Generator over the (node, depth) pairs of the tree, in preorder"""
+        stack = [(self, 0,)]
+
+        while stack:
+            node, depth = stack.pop()
 
-            node_types = ''
+            yield node, depth
 
-            for node_ty in inspect.getmro(type(root))[:-2]:
-                node_types += node_ty.__name__ + ' -> '
-            node_types = '(' + node_types.removesuffix(' -> ') + ')'
+            stack.extend((child, depth + 1,) for child in reversed(node.children))
+
+    def __str__(self):
+        def str_aux(root, depth):
+            node_types = ' -> '.join(
+                node_ty.__name__ for node_ty in type(root).__mro__[:-2])
+            node_types = '(' + node_types + ')'
 
             if root.lineno != None:
                 node_types += f' - line {root.lineno}'
 
             key = f'{root.key} ' if root.key != None else ''
 
-            s = '\t' * depth + f'{key}{node_types}\n'
-
-            for child in root.children:
-                s += str_aux(child, depth + 1)
-            return s
+            return '\t' * depth + f'{key}{node_types}\n'
 
-        return str_aux(self)
+        return ''.join(str_aux(node, depth) for node, depth in self.walk())
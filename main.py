@@ -1,64 +1,165 @@
 """Micro-C Program Analysis"""
 
 import argparse
+import os
+import sys
 
 from passes.parse import *
-from passes.cfg import *
 from passes.analysis import *
+from passes.report import *
 
 
 def main():
     parser = argparse.ArgumentParser(description="Micro-C Program Analysis")
-    parser.add_argument("--src-file", dest='src_file', type=str, required=True)
+    src_group = parser.add_mutually_exclusive_group(required=True)
+    src_group.add_argument("--src-file", dest='src_file', type=str)
+    src_group.add_argument("--batch", dest='batch', type=str, nargs='+',
+                           metavar='PATH',
+                           help="source files, directories or glob patterns")
+    parser.add_argument("--jobs", dest='jobs', type=int, default=None,
+                        help="number of worker processes in batch mode")
+    parser.add_argument("--parallel", dest='parallel', action='store_true',
+                        help="run the analyses concurrently")
+    parser.add_argument("--draw", dest='draw', action='store_true',
+                        help="render the program graph to SVG")
+    parser.add_argument("--draw-max-nodes", dest='draw_max_nodes', type=int,
+                        default=1000,
+                        help="skip rendering graphs with more nodes")
+    parser.add_argument("--output", dest='output', choices=['text', 'jsonl'],
+                        default='text',
+                        help="report format; jsonl streams one record per "
+                             "line")
+    parser.add_argument("--cache-dir", dest='cache_dir', type=str,
+                        default=None,
+                        help="reuse the results of unchanged sources, cached "
+                             "in this directory")
+    parser.add_argument("--cache-size", dest='cache_size', type=int,
+                        default=256, help="cache size bound, in MiB")
 
     args = vars(parser.parse_args())
 
+    cache = None
+
+    if args['cache_dir'] is not None:
+        from passes.cache import UCResultCache
+
+        cache = UCResultCache(args['cache_dir'], args['cache_size'] * 2**20)
+
+    if args['batch'] is not None:
+        # Sources are already analyzed in parallel, and not drawn
+        for arg in ('parallel', 'draw'):
+            if args[arg]:
+                parser.error(f'--{arg} cannot be used with --batch')
+
+        from passes.batch import run_batch
+
+        failed = run_batch(args['batch'], args['jobs'], args['output'], cache)
+        exit(1 if failed > 0 else 0)
+    elif args['jobs'] is not None:
+        parser.error('--jobs can only be used with --batch')
+
     with open(args['src_file'], 'r') as f:
         src = f.read()
 
+        jsonl = args['output'] == 'jsonl'
+
         # AST
-        ast = parse(src)
+        ast = cache.load(src, 'ast') if cache is not None else None
+
+        if ast is None:
+            try:
+                ast = parse(src)
+            except UCParseError as e:
+                if jsonl:
+                    write_jsonl(error_records(e, file=args['src_file']))
+                else:
+                    print("Errors:")
+                    for lineno, error in e.errors:
+                        print("\tIn line {}: {}".format(lineno, error))
+                exit(1)
+
+            if cache is not None:
+                cache.store(src, 'ast', ast)
+
+        if jsonl:
+            write_jsonl(ast_records(ast))
+        else:
+            print('UCASTNode (Abstract Syntax Tree) generated.\n')
+            print(ast)
+
+        # CFG (Program Graph), networkx is only imported from here on
+        from passes.cfg import UCProgramGraph
+
+        compact = cache.load(src, 'cfg') if cache is not None else None
+
+        if compact is not None:
+            cfg = UCProgramGraph.from_compact(compact)
+        else:
+            cfg = UCProgramGraph()
+            cfg = cfg.compute(ast)
+
+            if cache is not None:
+                cache.store(src, 'cfg', cfg.to_compact())
 
-        print('UCASTNode (Abstract Syntax Tree) generated.\n')
-        print(ast)
+        # Draw CFG
+        if args['draw'] and \
+                cfg.draw(args['src_file'], args['draw_max_nodes']) is None:
+            print(f'UCProgramGraph has {len(cfg)} nodes, not drawn '
+                  f'(--draw-max-nodes {args["draw_max_nodes"]}).',
+                  file=sys.stderr)
 
-        # CFG (Program Graph)
-        cfg = UCProgramGraph()
-        cfg = cfg.compute(ast)
+        if jsonl:
+            write_jsonl(cfg_records(cfg))
+        else:
+            print('UCProgramGraph generated.\n')
+            print(cfg)
 
-        # Draw CFG
-        cfg.draw(args['src_file'])
+        analyses = [UCReachingDefs, UCLiveVars,
+                    UCDangerousVars, UCDetectionSigns]
+
+        aas = [analysis(cfg) for analysis in analyses]
 
-        print('UCProgramGraph generated.\n')
-        print(cfg)
+        # Load the cached RD, LV, DV and DS assignments
+        computed = set()
 
-        # RD analysis
-        rd = UCReachingDefs(cfg)
-        rd.compute()
+        if cache is not None:
+            for aa in aas:
+                result = cache.load(src, type(aa).__name__)
 
-        # Print RD assignments
-        print(rd)
+                if result is not None:
+                    aa.result = result
+                    computed.add(aa)
 
-        # LV analysis
-        lv = UCLiveVars(cfg)
-        lv.compute()
+        # Run the other analyses concurrently
+        if args['parallel'] and len(computed) < len(aas):
+            from passes.scheduler import UCAnalysisScheduler
 
-        # Print LV assignments
-        print(lv)
+            pending = [aa for aa in aas if aa not in computed]
+            scheduled = UCAnalysisScheduler(
+                cfg, [type(aa) for aa in pending]).compute()
 
-        # DV analysis
-        dv = UCDangerousVars(cfg)
-        dv.compute()
+            for aa, aa_ in zip(pending, scheduled):
+                aa.result = aa_.result
 
-        # Print DV assignments
-        print(dv)
+        # Compute and print RD, LV, DV and DS assignments, one at a time
+        for aa in aas:
+            if not args['parallel'] and aa not in computed:
+                aa.compute()
 
-        # DS analysis
-        ds = UCDetectionSigns(cfg)
-        ds.compute()
+            if cache is not None and aa not in computed:
+                cache.store(src, type(aa).__name__, aa.result)
 
-        # Print DS assignments
-        print(ds)
+            if jsonl:
+                write_jsonl(analysis_records(aa))
+            else:
+                print(aa)
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    except BrokenPipeError:
+        # The reader of the report went away (e.g. `| head`): exit quietly,
+        # without flushing stdout to the closed pipe at exit
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
@@ -4,20 +4,142 @@ import math
 
 from itertools import product
 from functools import reduce
+from operator import or_
 
 from lang.ops import *
 from utils.decorators import classproperty
 
+from .internal.bitvector import UCBitVector
+from .internal.domain import *
+from .internal.signs import *
 from .internal.worklist import *
 
 
+class UCTransfer:
+    """Transfer summary (action, gen, kill and free variables) of an edge"""
+
+    def __init__(self, action, gen=None, kill=None, fv=None):
+        self.action = action
+        self.gen = gen if gen is not None else set()
+        self.kill = kill if kill is not None else set()
+        self.fv = fv if fv is not None else set()
+
+
 class UCAnalysis:
     """Micro-C Program Analysis"""
 
-    def __init__(self, cfg):
+    def __init__(self, cfg, bitvector=False, strategy=UCRRStrategy,
+                 solver=UCWorklist):
         self.cfg = cfg
+        self.bitvector = bitvector
+        self.strategy = strategy
+        self.solver = solver
+        self.index = None
+        self.masks = None
+        self.bv = None
         self.aa = {}
         self.iters = -1
+        # Iterations spent in each strongly connected component, keyed by
+        # its nodes, when solved by `UCSCCWorklist`
+        self.scc_iters = {}
+        self._transfer = None
+        self._transfer_version = None
+
+    def summary(self, u, v):
+        """Transfer summary of the edge (u, v)"""
+        return UCTransfer(self.cfg.edges[u, v]['action'], fv=self.fv(u, v))
+
+    @property
+    def transfer(self):
+        """Transfer summaries of all the edges, compiled by walking each edge
+        action once and recompiled only when the CFG changes"""
+        if self._transfer is None or self._transfer_version != self.cfg.version:
+            self._transfer = {(u, v): self.summary(u, v)
+                              for u, v in self.cfg.edges}
+            self._transfer_version = self.cfg.version
+
+        return self._transfer
+
+    @property
+    def aa(self):
+        # Decode the bit-vector assignments on demand
+        if self._aa is None:
+            self._aa = {q: self.decode(bv_q) for q, bv_q in self.bv.items()}
+
+        return self._aa
+
+    @aa.setter
+    def aa(self, aa):
+        self._aa = aa
+
+    def decode(self, mask):
+        return self.index.decode(mask)
+
+    @property
+    def result(self):
+        """Solution of the analysis, without the program graph"""
+        return self._aa, self.bv, self.index, self.iters, self.scc_iters
+
+    @result.setter
+    def result(self, result):
+        self._aa, self.bv, self.index, self.iters, self.scc_iters = result
+
+    def solve(self, X, seed=None):
+        """Compute the MFP solution from the assignment `X`, in place, and
+        return the number of iterations. The iterations of each component
+        are kept in `scc_iters` if the solver reports them. Frozen solvers
+        run on the array-backed snapshot of the graph"""
+        if not self.solver.frozen:
+            ucw = self.solver(self.cfg, self.domain(), X,
+                              strategy=self.strategy, seed=seed)
+            iters = ucw.compute()
+
+            self.scc_iters = dict(getattr(ucw, 'scc_iters', {}))
+
+            return iters
+
+        g = self.cfg.freeze()
+        seed = {g.ids[q] for q in seed} if seed is not None else None
+        R = [X[q] for q in g.labels]
+
+        ucw = self.solver(g, self.domain(g), R, strategy=self.strategy,
+                          seed=seed)
+        iters = ucw.compute()
+
+        X.update(zip(g.labels, R))
+
+        # Key the components by node label rather than by node id
+        self.scc_iters = {tuple(g.labels[x] for x in scc): scc_iters
+                          for scc, scc_iters in
+                          getattr(ucw, 'scc_iters', {}).items()}
+
+        return iters
+
+    @abstractmethod
+    def domain(self, g=None):
+        """Abstract domain of the analysis (see `UCAbstractDomain`), with the
+        transfer function over the edges of the program graph or, on the
+        frozen graph `g`, over its edge ids"""
+        raise NotImplementedError()
+
+    def edge_keyed(self, g, values):
+        """`values` keyed by edge, keyed by the edge ids of the frozen graph
+        `g` instead (as they are if `g` is None)"""
+        if g is None:
+            return values
+
+        return [values[g.labels[u], g.labels[v]] for u, v in g.edges()]
+
+    @staticmethod
+    def gen_kill_fn(masks):
+        """Gen/kill transfer function, over the masks keyed by edge or, on
+        frozen graphs, by edge id"""
+        def transfer_impl(R, u, v, e=None):
+            kill_uv, gen_uv = masks[(u, v) if e is None else e]
+
+            return R[u] & ~kill_uv | gen_uv
+
+        return transfer_impl
 
     @classproperty
     def jolly_node(cls):
@@ -57,55 +179,194 @@ class UCAnalysis:
         else:
             return set()
 
-    @abstractmethod
-    def __str__(self, pfx, fmt, forward=True):
-        s = f'{type(self).__name__} analysis performed in {self.iters} iterations.\n\n'
+    def affected(self, prev):
+        """Nodes whose assignments may differ from those of `prev`, the same
+        analysis of an earlier version of the program: the nodes reachable
+        from an edge which was added, removed or whose action changed. None
+        if the source or the declarations changed, i.e. every node may be
+        affected"""
+        cfg, cfg_prev = self.cfg, prev.cfg
+
+        def decls(g): return {x: (type(d), str(d)) for x, d in g.vars.items()}
+
+        if cfg.source != cfg_prev.source or decls(cfg) != decls(cfg_prev):
+            return None
+
+        succ, succ_prev = cfg.succ, cfg_prev.succ
+        changed = {q for q in cfg.nodes if q not in cfg_prev}
+
+        for u, v, a in cfg.edges(data='action'):
+            uv_prev = succ_prev[u].get(v) if u in succ_prev else None
+
+            if uv_prev is None or str(uv_prev['action']) != str(a):
+                changed.add(v)
+
+        changed.update(v for u, v in cfg_prev.edges
+                       if v in succ and (u not in succ or v not in succ[u]))
+
+        affected = set(changed)
+        stack = list(changed)
+
+        while stack:
+            for y in succ[stack.pop()]:
+                if y not in affected:
+                    affected.add(y)
+                    stack.append(y)
+
+        return affected
+
+    def carry(self, prev, q):
+        """Assignment of `prev` at `q`, in the representation of this
+        analysis"""
+        aa_q = prev.decode(prev.bv[q]) if prev._aa is None else prev.aa[q]
+
+        if self.bitvector:
+            return self.index.encode(aa_q)
+        elif isinstance(aa_q, dict):
+            return {x: set(aa_x) for x, aa_x in aa_q.items()}
+
+        return set(aa_q)
+
+    def reuse(self, prev, X):
+        """Start from the solution of `prev` at the nodes not affected by the
+        changes since (see `affected`). Returns the nodes to seed the worklist
+        with, or None if the analysis must be solved from scratch"""
+        if prev is None:
+            return None
+
+        affected = self.affected(prev)
+
+        if affected is None:
+            return None
+
+        if self.bitvector and prev.bv is not None and \
+                prev.index.elems == self.index.elems:
+            # Same encoding, the masks are carried over as they are
+            carried = {q: prev.bv[q] for q in X if q not in affected}
+        else:
+            try:
+                carried = {q: self.carry(prev, q)
+                           for q in X if q not in affected}
+            except KeyError:
+                # Elements unknown to the current index (e.g. renamed
+                # variables)
+                return None
+
+        X.update(carried)
+
+        # The affected nodes, and the nodes they are updated from
+        seed = set(affected)
+        seed.update(u for v in affected for u in self.cfg.predecessors(v))
 
+        return seed
+
+    def node_order(self, forward=True):
+        """Nodes sorted by label, with the source first and the sink last
+        (or vice versa if not `forward`)"""
         source_key = -1 if forward else math.inf
         sink_key = math.inf if forward else -1
 
-        def sort_pred(kv): return int(kv[0])\
-            if kv[0] not in [self.cfg.source, self.cfg.sink]\
-            else (source_key if kv[0] == self.cfg.source else sink_key)
+        def sort_pred(q): return int(q)\
+            if q not in [self.cfg.source, self.cfg.sink]\
+            else (source_key if q == self.cfg.source else sink_key)
+
+        return sorted(self.cfg.nodes, key=sort_pred)
+
+    def facts(self, forward=True):
+        """Generator over the (node, fact) pairs of the solution. Bit-vector
+        assignments are decoded one node at a time"""
+        for q in self.node_order(forward):
+            if self._aa is None:
+                aa_ = self.decode(self.bv[q])
+            else:
+                aa_ = self.aa[q]
+
+            for ae in aa_.items() if isinstance(aa_, dict) else aa_:
+                yield q, ae
+
+    def fact_record(self, ae):
+        """JSON-serializable form of a fact"""
+        return str(ae)
+
+    @abstractmethod
+    def __str__(self, pfx, fmt, forward=True):
+        s = [f'{type(self).__name__} analysis performed in {self.iters} iterations.\n\n']
 
-        for q, aa_ in sorted(self.aa.items(), key=sort_pred):
-            s += f'{pfx}({q}): '
+        for q in self.node_order(forward):
+            aa_ = self.aa[q]
 
             if len(aa_) > 0:
-                for ae in aa_.items() if isinstance(aa_, dict) else aa_:
-                    s += fmt(ae) + ', '
+                aes = ', '.join(
+                    fmt(ae) for ae in (aa_.items() if isinstance(aa_, dict) else aa_))
             else:
-                s += '∅'
+                aes = '∅'
 
-            s = s.removesuffix(', ') + '\n'
+            s.append(f'{pfx}({q}): {aes}\n')
 
-        return s
+        return ''.join(s)
 
 
 class UCReachingDefs(UCAnalysis):
     """Reaching definitions analysis"""
 
-    def __init__(self, cfg):
-        super().__init__(cfg)
+    def __init__(self, cfg, bitvector=True, strategy=UCRRStrategy,
+                 solver=UCWorklist):
+        super().__init__(cfg, bitvector, strategy, solver)
 
-    @property
-    def analysis_fn(self):
-        def analysis_fn_impl(R, u, v):
-            kill_uv = set(self.killset(u, v))
-            gen_uv = set(self.genset(u, v))
+    def domain(self, g=None):
+        if self.bitvector:
+            return UCBitVectorDomain(
+                UCAnalysis.gen_kill_fn(self.edge_keyed(g, self.masks)))
 
-            rd_u_not_kill_uv = R[u].difference(kill_uv)
+        transfer = self.edge_keyed(g, self.transfer)
 
-            if not rd_u_not_kill_uv.union(gen_uv).issubset(R[v]):
-                R[v] = R[v].union(
-                    rd_u_not_kill_uv).union(gen_uv)
-                return True
+        def transfer_impl(R, u, v, e=None):
+            t_uv = transfer[(u, v) if e is None else e]
 
-            return False
+            # Kill every definition of the variables killed by the edge
+            if t_uv.kill:
+                rd_u_not_kill_uv = {d for d in R[u] if d[0] not in t_uv.kill}
+            else:
+                rd_u_not_kill_uv = R[u]
 
-        return analysis_fn_impl
+            return rd_u_not_kill_uv.union(t_uv.gen)
 
-    def killset(self, u, v):
+        return UCPowersetDomain(transfer_impl)
+
+    def summary(self, u, v):
+        return UCTransfer(self.cfg.edges[u, v]['action'],
+                          gen=set(self.genset(u, v) or []),
+                          kill=set(self.killvars(u, v)))
+
+    def compute_masks(self):
+        """Assign a dense index to every definition and compute the
+        gen/kill masks of each edge"""
+        transfer = self.transfer
+
+        self.index = UCBitVector(product(self.cfg.vars,
+                                         [UCReachingDefs.jolly_node],
+                                         [self.cfg.source]))
+
+        for t_uv in transfer.values():
+            for d in t_uv.gen:
+                self.index.add(d)
+
+        var_masks = {}
+
+        for i, d in enumerate(self.index):
+            var_masks[d[0]] = var_masks.get(d[0], 0) | 1 << i
+
+        self.masks = {}
+
+        for uv, t_uv in transfer.items():
+            kill_uv = 0
+
+            for var_id in t_uv.kill:
+                kill_uv |= var_masks.get(var_id, 0)
+
+            self.masks[uv] = (kill_uv, self.index.encode(t_uv.gen),)
+
+    def killvars(self, u, v):
         uv = self.cfg.edges[u, v]
         a = uv['action']
 
@@ -124,7 +385,15 @@ class UCReachingDefs(UCAnalysis):
             elif isinstance(var, UCRecord):
                 return []
             else:
-                return product([var_id], self.nodes_ex, self.cfg.nodes)
+                return [var_id]
+        else:
+            return []
+
+    def killset(self, u, v):
+        var_ids = self.killvars(u, v)
+
+        if len(var_ids) > 0:
+            return product(var_ids, self.nodes_ex, self.cfg.nodes)
         else:
             return []
 
@@ -147,27 +416,63 @@ class UCReachingDefs(UCAnalysis):
         else:
             return []
 
-    def compute(self, copy=False):
+    def compute(self, copy=False, prev=None):
+        if self.bitvector:
+            return self.compute_bv(copy, prev)
+
         rd = {}
 
         # Compute initial RD assignments
+        bottom = self.domain().bottom
+
         for q in self.cfg.nodes:
             if q != self.cfg.source:
-                rd[q] = set()
+                rd[q] = bottom()
 
         rd[self.cfg.source] = set(product(self.cfg.vars,
                                           [UCReachingDefs.jolly_node],
                                           [self.cfg.source]))
 
+        # Reuse the previous solution at the unaffected nodes
+        seed = self.reuse(prev, rd)
+
         # Compute the MFP solution for RD assignments
-        ucw = UCWorklist(self.cfg, self.analysis_fn, rd, strategy=UCRRStrategy)
-        self.iters = ucw.compute()
+        self.iters = self.solve(rd, seed)
 
         if copy:
             return rd
 
         self.aa = rd
 
+    def compute_bv(self, copy=False, prev=None):
+        self.compute_masks()
+
+        rd = {}
+
+        # Compute initial RD assignments
+        bottom = self.domain().bottom
+
+        for q in self.cfg.nodes:
+            rd[q] = bottom()
+
+        # The initial definitions are the first |vars| indices
+        rd[self.cfg.source] = (1 << len(self.cfg.vars)) - 1
+
+        # Reuse the previous solution at the unaffected nodes
+        seed = self.reuse(prev, rd)
+
+        # Compute the MFP solution for RD assignments
+        self.iters = self.solve(rd, seed)
+
+        if copy:
+            return {q: self.decode(rd_q) for q, rd_q in rd.items()}
+
+        self.bv = rd
+        self.aa = None
+
+    def fact_record(self, ae):
+        return [str(ae[0]), ae[1], ae[2]]
+
     def __str__(self):
         return super().__str__(
             'RD', lambda aa: f'({str(aa[0])}, {aa[1]}, {aa[2]})')
@@ -176,8 +481,9 @@ class UCReachingDefs(UCAnalysis):
 class UCLiveVars(UCAnalysis):
     """Live variable analysis"""
 
-    def __init__(self, cfg):
-        super().__init__(cfg.reverse())
+    def __init__(self, cfg, bitvector=True, strategy=UCRRStrategy,
+                 solver=UCWorklist):
+        super().__init__(cfg.reverse(), bitvector, strategy, solver)
 
     def killset(self, u, v):
         uv = self.cfg.edges[u, v]
@@ -202,22 +508,41 @@ class UCLiveVars(UCAnalysis):
         else:
             return []
 
-    @property
-    def analysis_fn(self):
-        def analysis_fn_impl(R, u, v):
-            kill_uv = set(self.killset(u, v))
-            gen_uv = set(self.genset(u, v))
+    def domain(self, g=None):
+        if self.bitvector:
+            return UCBitVectorDomain(
+                UCAnalysis.gen_kill_fn(self.edge_keyed(g, self.masks)))
+
+        transfer = self.edge_keyed(g, self.transfer)
+
+        def transfer_impl(R, u, v, e=None):
+            t_uv = transfer[(u, v) if e is None else e]
+
+            return R[u].difference(t_uv.kill).union(t_uv.gen)
 
-            rd_u_not_kill_uv = R[u].difference(kill_uv)
+        return UCPowersetDomain(transfer_impl)
 
-            if not rd_u_not_kill_uv.union(gen_uv).issubset(R[v]):
-                R[v] = R[v].union(
-                    rd_u_not_kill_uv).union(gen_uv)
-                return True
+    def summary(self, u, v):
+        return UCTransfer(self.cfg.edges[u, v]['action'],
+                          gen=set(self.genset(u, v)),
+                          kill=set(self.killset(u, v)))
 
-            return False
+    def compute_masks(self):
+        """Compute the gen/kill variable masks of each edge"""
+        self.index = self.cfg.var_index.copy()
+        self.masks = {}
 
-        return analysis_fn_impl
+        for uv, t_uv in self.transfer.items():
+            # Identifiers which are not program variables (e.g. record
+            # fields) are live too
+            for x in t_uv.gen:
+                self.index.add(x)
+
+            self.masks[uv] = (self.index.encode(t_uv.kill),
+                              self.index.encode(t_uv.gen),)
+
+    def decode(self, mask):
+        return sorted(self.index.decode(mask), key=lambda v: str(v))
 
     def __genset(self, node, storage):
         if isinstance(node, UCRecordInitializerList):
@@ -260,16 +585,23 @@ class UCLiveVars(UCAnalysis):
 
         return list(set(storage))
 
-    def compute(self, copy=False):
+    def compute(self, copy=False, prev=None):
+        if self.bitvector:
+            return self.compute_bv(copy, prev)
+
         lv = {}
 
         # Compute initial LV assignments
+        bottom = self.domain().bottom
+
         for q in self.cfg.nodes:
-            lv[q] = set()
+            lv[q] = bottom()
+
+        # Reuse the previous solution at the unaffected nodes
+        seed = self.reuse(prev, lv)
 
         # Compute the MFP solution for LV assignments
-        ucw = UCWorklist(self.cfg, self.analysis_fn, lv, strategy=UCRRStrategy)
-        self.iters = ucw.compute()
+        self.iters = self.solve(lv, seed)
 
         # Sort LV assignment vales by identifier
         lv = {k: sorted(v, key=lambda v: str(v)) for k, v in lv.items()}
@@ -279,6 +611,29 @@ class UCLiveVars(UCAnalysis):
 
         self.aa = lv
 
+    def compute_bv(self, copy=False, prev=None):
+        self.compute_masks()
+
+        lv = {}
+
+        # Compute initial LV assignments
+        bottom = self.domain().bottom
+
+        for q in self.cfg.nodes:
+            lv[q] = bottom()
+
+        # Reuse the previous solution at the unaffected nodes
+        seed = self.reuse(prev, lv)
+
+        # Compute the MFP solution for LV assignments
+        self.iters = self.solve(lv, seed)
+
+        if copy:
+            return {q: self.decode(lv_q) for q, lv_q in lv.items()}
+
+        self.bv = lv
+        self.aa = None
+
     def __str__(self):
         return super().__str__('LV', lambda aa: f'{str(aa)}', forward=False)
 
@@ -286,137 +641,260 @@ class UCLiveVars(UCAnalysis):
 class UCDangerousVars(UCAnalysis):
     """UC Dangerous Vars"""
 
-    def __init__(self, cfg):
-        super().__init__(cfg)
+    def __init__(self, cfg, bitvector=True, strategy=UCRRStrategy,
+                 solver=UCWorklist):
+        super().__init__(cfg, bitvector, strategy, solver)
 
-    @property
-    def analysis_fn(self):
-        def analysis_fn_impl(R, u, v):
-            uv = self.cfg.edges[u, v]
-            a = uv['action']
-            fv = set(self.fv(u, v))
+    def domain(self, g=None):
+        if self.bitvector:
+            return UCBitVectorDomain(
+                UCDangerousVars.dv_fn_bv(self.edge_keyed(g, self.masks)))
+
+        transfer = self.edge_keyed(g, self.transfer)
+
+        def transfer_impl(R, u, v, e=None):
+            t_uv = transfer[(u, v) if e is None else e]
+            a, fv = t_uv.action, t_uv.fv
+
+            if not isinstance(a, UCAssignment):
+                return R[u]
+            # x := a
+            elif isinstance(a.lhs, UCIdentifier):
+                if fv.intersection(R[u]) == set():
+                    return R[u].difference([a.lhs])
+                else:
+                    return R[u].union([a.lhs])
+            # A[a1] := a2, R.fst := a
+            elif isinstance(a.lhs, UCArrayDeref) or \
+                    isinstance(a.lhs, UCRecordDeref):
+                if fv.intersection(R[u]) != set():
+                    return R[u].union([a.lhs.lhs])
+
+            return R[u]
+
+        return UCPowersetDomain(transfer_impl)
+
+    @staticmethod
+    def dv_fn_bv(masks):
+        """Bit-vector DV transfer function, over the masks keyed by edge or,
+        on frozen graphs, by edge id"""
+        def transfer_impl(R, u, v, e=None):
+            lhs_ty, x, fv = masks[(u, v) if e is None else e]
+
+            if lhs_ty is None:
+                return R[u]
+            # x := a
+            elif lhs_ty is UCIdentifier:
+                return R[u] & ~x if fv & R[u] == 0 else R[u] | x
+            # A[a1] := a2, R.fst := a
+            elif fv & R[u] == 0:
+                return R[u]
+
+            return R[u] | x
+
+        return transfer_impl
+
+    def compute_masks(self):
+        """Compute the assigned and free variable masks of each edge"""
+        self.index = self.cfg.var_index.copy()
+        self.masks = {}
 
-            updated = False
+        for uv, t_uv in self.transfer.items():
+            a = t_uv.action
+
+            for x in t_uv.fv:
+                self.index.add(x)
 
             if isinstance(a, UCAssignment):
-                # x := a
-                if isinstance(a.lhs, UCIdentifier):
-                    if fv.intersection(R[u]) == set():
-                        if not R[u].difference([a.lhs]).issubset(R[v]):
-                            R[v] = R[v].union(R[u].difference([a.lhs]))
-                            updated = True
-                    else:
-                        if not R[u].union([a.lhs]).issubset(R[v]):
-                            R[v] = R[v].union(R[u].union([a.lhs]))
-                            updated = True
-                # A[a1] := a2
-                elif isinstance(a.lhs, UCArrayDeref):
-                    if fv.intersection(R[v]) != set():
-                        if not R[u].union([a.lhs.lhs]).issubset(R[v]):
-                            R[v] = R[v].union(R[u].union([a.lhs.lhs]))
-                            updated = True
-                # R.fst := a
-                elif isinstance(a.lhs, UCRecordDeref):
-                    if fv.intersection(R[v]) != set():
-                        if not R[u].union([a.lhs.lhs]).issubset(R[v]):
-                            R[v] = R[v].union(R[u].union([a.lhs.lhs]))
-                            updated = True
-            else:
-                if not R[u].issubset(R[v]):
-                    R[v] = R[u]
-                    updated = True
+                x = a.lhs if isinstance(a.lhs, UCIdentifier) else a.lhs.lhs
+                self.index.add(x)
 
-            return updated
+                self.masks[uv] = (type(a.lhs), self.index.bit(x),
+                                  self.index.encode(t_uv.fv),)
+            else:
+                self.masks[uv] = (None, 0, 0,)
 
-        return analysis_fn_impl
+    def compute(self, copy=False, prev=None):
+        if self.bitvector:
+            return self.compute_bv(copy, prev)
 
-    def compute(self, copy=False):
         dv = {}
 
         # Initial DV assignment
+        bottom = self.domain().bottom
+
         for q in self.cfg.nodes:
-            dv[q] = set()
+            dv[q] = bottom()
         
         dv[self.cfg.source] = set(self.cfg.vars)
 
+        # Reuse the previous solution at the unaffected nodes
+        seed = self.reuse(prev, dv)
+
         # Compute the MFP solution for DV assignments
-        ucw = UCWorklist(self.cfg, self.analysis_fn, dv, strategy=UCRRStrategy)
-        self.iters = ucw.compute()
+        self.iters = self.solve(dv, seed)
 
         if copy:
             return dv
 
         self.aa = dv
 
+    def compute_bv(self, copy=False, prev=None):
+        self.compute_masks()
+
+        dv = {}
+
+        # Initial DV assignment
+        bottom = self.domain().bottom
+
+        for q in self.cfg.nodes:
+            dv[q] = bottom()
+
+        dv[self.cfg.source] = self.index.encode(self.cfg.vars)
+
+        # Reuse the previous solution at the unaffected nodes
+        seed = self.reuse(prev, dv)
+
+        # Compute the MFP solution for DV assignments
+        self.iters = self.solve(dv, seed)
+
+        if copy:
+            return {q: self.decode(dv_q) for q, dv_q in dv.items()}
+
+        self.bv = dv
+        self.aa = None
+
     def __str__(self):
         return super().__str__('DV', lambda dv: f'{str(dv)}')
 
 
-class UCDetectionSigns(UCAnalysis):
-    """Reaching definitions analysis"""
+class UCSignsDomain(UCBitVectorDomain):
+    """Packed DS abstract memories (see `UCDetectionSigns`), interned by
+    `intern` when joined"""
+
+    def __init__(self, transfer, intern):
+        super().__init__(transfer)
+        self.intern = intern
+
+    def join(self, x, y):
+        return self.intern(x | y)
+
+    def update(self, R, u, v, e=None):
+        r_uv = self.transfer(R, u, v, e)
 
-    def __init__(self, cfg):
-        super().__init__(cfg)
+        if r_uv is not None and r_uv & ~R[v]:
+            R[v] = self.join(R[v], r_uv)
+            return True
+
+        return False
+
+
+class UCDetectionSigns(UCAnalysis):
+    """Detection of signs analysis"""
+
+    def __init__(self, cfg, strategy=UCRRStrategy, solver=UCWorklist,
+                 memo_size=2**16):
+        super().__init__(cfg, strategy=strategy, solver=solver)
+
+        # Abstract memories are packed in an integer, with the sign mask of
+        # the i-th variable in bits 3i to 3i + 2
+        self.index = UCBitVector(cfg.vars)
+        self.shifts = {x: 3 * i for x, i in self.index.index.items()}
+        self.scalars = [x for x, var in cfg.vars.items()
+                        if not isinstance(var, UCArray) and
+                        not isinstance(var, UCRecord)]
+        self.mems = {}
+
+        # Evaluations of the edge actions (see `evaluate`), at most
+        # `memo_size` of them, the oldest are dropped first. They are keyed
+        # by edge, so they are dropped when the CFG changes
+        self.memo_size = memo_size
+        self.memo_hits = 0
+        self.memo_misses = 0
+        self.__memo = {}
+        self.__memo_version = None
 
     @classproperty
     def signs(cls):
-        return set(['-', '0', '+'])
+        return SIGNS
 
     @classproperty
     def bool(cls):
-        return set(['tt', 'ff'])
+        return BOOLS
 
     def __to_abstract_mem(self, vars):
-        return { id: self.__to_abstract(var) for id, var in vars.items() }
+        return reduce(or_, [self.__to_abstract(var) << self.shifts[id]
+                            for id, var in vars.items()], 0)
 
     def __to_abstract(self, var):
         if isinstance(var, UCRecord):
-            return set(
-                reduce(set.union, list(
-                    map(lambda f: self.get_sign({}, f.value), var.fields)), set())
-                )
+            return reduce(or_, [self.get_sign(0, f.value)
+                                for f in var.fields], 0)
         elif isinstance(var, UCArray):
-            return set(
-                reduce(set.union, list(
-                    map(lambda v: self.get_sign({}, v), var.value)), set())
-                )
+            return reduce(or_, [self.get_sign(0, v) for v in var.value], 0)
         else:
-            return self.get_sign({}, var.value)
+            return self.get_sign(0, var.value)
+
+    def __to_basic_mem(self, mem, split=None):
+        """Split the abstract memory into basic memories, where each scalar
+        variable in `split` (all of them by default) has a single sign. The
+        other variables keep all of their signs"""
+        shifts = []
+
+        for x in self.scalars:
+            s = self.shifts[x]
+
+            if split is None or x in split:
+                shifts.append(s)
+            elif mem >> s & SIGNS == 0:
+                # Scalars which are not split have no sign, there is no
+                # basic memory at all
+                return []
 
-    def __to_basic_mem(self, mem):
-        basic_mems = list()
-        mem_, mem_am_ = dict(), dict() # Amalgamated and non- abstract memories
+        # Amalgamated variables, and scalars which are not split, are kept
+        # whole
+        basic_mems = [mem & ~sum(SIGNS << s for s in shifts)]
 
-        # Split the abstract memory based on whether the variable type is
-        # amalgamated or not
-        for var_id, sign in mem.items():
-            var = self.cfg.vars[var_id]
+        for s in shifts:
+            basic_mems = [m | sign << s for m in basic_mems
+                          for sign in bits(mem >> s & SIGNS)]
 
-            if isinstance(var, UCArray) or isinstance(var, UCRecord):
-                if var_id not in mem_am_:
-                    mem_am_[var_id] = set()
-                mem_am_[var_id] = mem_am_[var_id].union(mem[var_id])
-            else:
-                if var_id not in mem_:
-                    mem_[var_id] = set()
-                mem_[var_id] = mem_[var_id].union(mem[var_id])
+        return basic_mems
+
+    def guard_vars(self, a):
+        """Variables read by the guard `a`"""
+        return {a_ for a_, _ in a.walk() if isinstance(a_, UCIdentifier)}
 
-        sign_product = list(product(*mem_.values()))
+    def reads(self, a):
+        """Mask of the variables read by the action `a`, and mask of the
+        lowest sign bit of the scalars it does not read"""
+        if isinstance(a, UCAssignment):
+            a = a.rhs
 
-        for signs in sign_product:
-            basic_mem = {}
+        shifts = self.shifts
+        vars = {a_ for a_, _ in a.walk()
+                if isinstance(a_, UCIdentifier) and a_ in shifts}
 
-            for var_id, sign in zip(mem_.keys(), signs):
-                var = self.cfg.vars[var_id]
-                basic_mem[var_id] = set([sign])
+        return sum(SIGNS << shifts[x] for x in vars), \
+            sum(1 << shifts[x] for x in self.scalars if x not in vars)
 
-            basic_mems.append(basic_mem)
+    def evaluate(self, a, mem):
+        """Sign of the right-hand side of the assignment `a` or, if `a` is a
+        guard, union of the basic memories where it may hold (None if there
+        are none)"""
+        if isinstance(a, UCAssignment):
+            return self.get_sign(mem, a.rhs)
 
-        # Merge amalgamated and non- basic memories
-        for i in range(len(basic_mems)):
-            basic_mems[i] = self.__aa_union(basic_mems[i], mem_am_)
+        # Only the variables tested by the guard are split
+        basic_mems = [basic_mem for basic_mem in
+                      self.__to_basic_mem(mem, self.guard_vars(a))
+                      if self.get_bool(basic_mem, a) & TT]
 
-        return basic_mems
+        return reduce(or_, basic_mems) if len(basic_mems) > 0 else None
+
+    def intern(self, mem):
+        """Shared instance of the abstract memory `mem`"""
+        return self.mems.setdefault(mem, mem)
 
     @property
     def initial_mem(self):
@@ -424,410 +902,171 @@ class UCDetectionSigns(UCAnalysis):
 
     @property
     def empty_mem(self):
-        return { id: set() for id, _ in self.cfg.vars.items() }
+        return 0
 
     def get_sign(self, mem, a):
+        """Sign mask of the arithmetic expression `a` in the memory `mem`"""
         assert isinstance(a, UCAExpression)
 
+        shifts = self.shifts
+
         def get_sign_aux(mem, a):
-            sign = set()
-
-            if isinstance(a, UCAExpression):
-                if isinstance(a, UCNumberLiteral):
-                    if a.value < 0:
-                        sign.add('-')
-                    elif a.value == 0:
-                        sign.add('0')
-                    else:
-                        sign.add('+')
-                elif isinstance(a, UCRecordInitializerList):
-                    sign = set(
-                        reduce(set.union, list(
-                            map(lambda v: get_sign_aux(mem, v), a.value)), set())
-                    )
-                elif isinstance(a, UCIdentifier):
-                    sign = sign.union(mem[a])
-                elif isinstance(a, UCArrayDeref):
-                    sign_rhs = get_sign_aux(mem, a.rhs)
-
-                    if sign_rhs.intersection(['0', '+']) != set():
-                        sign = sign.union(mem[a.lhs])
-                    else:
-                        sign = self.empty_mem
-                elif isinstance(a, UCRecordDeref):
-                    sign = sign.union(mem[a.lhs])
-                elif isinstance(a, UCAdd):
-                    sign_lhs = get_sign_aux(mem, a.lhs)
-                    sign_rhs = get_sign_aux(mem, a.rhs)
-
-                    for s1 in sign_lhs:
-                        for s2 in sign_rhs:
-                            if s1 == '-' and s2 == '-' or\
-                                    s1 == '-' and s2 == '0' or\
-                                    s1 == '0' and s2 == '-':
-                                sign.add('-')
-                            elif s1 == '-' and s2 == '+' or s1 == '+' and s2 == '-':
-                                sign = self.signs
-                            elif s1 == '0' and s2 == '0':
-                                sign.add('0')
-                            else:
-                                sign.add('+')
-                elif isinstance(a, UCSub):
-                    sign_lhs = get_sign_aux(mem, a.lhs)
-                    sign_rhs = get_sign_aux(mem, a.rhs)
-
-                    for s1 in sign_lhs:
-                        for s2 in sign_rhs:
-                            if s1 == '-' and s2 == '0' or\
-                                    s1 == '-' and s2 == '+' or\
-                                    s1 == '0' and s2 == '+':
-                                sign.add('-')
-                            elif s1 == '+' and s2 == '+' or s1 == '-' and s2 == '-':
-                                sign = self.signs
-                            elif s1 == '0' and s2 == '0':
-                                sign.add('0')
-                            else:
-                                sign.add('+')
-                elif isinstance(a, UCMul):
-                    sign_lhs = get_sign_aux(mem, a.lhs)
-                    sign_rhs = get_sign_aux(mem, a.rhs)
-
-                    for s1 in sign_lhs:
-                        for s2 in sign_rhs:
-                            if s1 == '+' and s2 == '-' or\
-                                    s1 == '-' and s2 == '+':
-                                sign.add('-')
-                            elif s1 == '-' and s2 == '-' or\
-                                    s1 == '+' and s2 == '+':
-                                sign.add('+')
-                            else:
-                                sign.add('0')
-                elif isinstance(a, UCDiv):
-                    sign_lhs = get_sign_aux(mem, a.lhs)
-                    sign_rhs = get_sign_aux(mem, a.rhs)
-
-                    for s1 in sign_lhs:
-                        for s2 in sign_rhs:
-                            if s1 == '+' and s2 == '-' or\
-                                    s1 == '-' and s2 == '+':
-                                sign.add('-')
-                            elif s1 == '-' and s2 == '-' or\
-                                    s1 == '+' and s2 == '+':
-                                sign.add('+')
-                            elif s2 == '0':
-                                sign = self.empty_mem
-                            else:
-                                sign.add('0')
-                elif isinstance(a, UCMod):
-                    # In the modulo operator, the sign is equal to the
-                    # sign of the divisor (rhs)
-                    sign_lhs = get_sign_aux(mem, a.lhs)
-                    sign_rhs = get_sign_aux(mem, a.rhs)
-
-                    for s1 in sign_lhs:
-                        for s2 in sign_rhs:
-                            if s2 == '+':
-                                sign.add('+')
-                            elif s2 == '-':
-                                sign.add('-')
-                            else: # s2 == '0'
-                                sign = self.empty_mem
-
-            return sign
+            if isinstance(a, UCNumberLiteral):
+                return sign_of(a.value)
+            elif isinstance(a, UCRecordInitializerList):
+                return reduce(or_, [get_sign_aux(mem, v) for v in a.value], 0)
+            elif isinstance(a, UCIdentifier):
+                return mem >> shifts[a] & SIGNS
+            elif isinstance(a, UCArrayDeref):
+                # Negative indices are out of bounds
+                if get_sign_aux(mem, a.rhs) & (ZERO | PLUS):
+                    return mem >> shifts[a.lhs] & SIGNS
+
+                return 0
+            elif isinstance(a, UCRecordDeref):
+                return mem >> shifts[a.lhs] & SIGNS
+
+            op = SIGN_TABLES.get(type(a))
+
+            if op is None:
+                return 0
+
+            return op[get_sign_aux(mem, a.lhs) << 3 | get_sign_aux(mem, a.rhs)]
 
         return get_sign_aux(mem, a)
 
     def get_bool(self, mem, a):
+        """Truth value mask of the boolean expression `a` in the memory
+        `mem`"""
         assert isinstance(a, UCRExpression) or isinstance(a, UCBExpression)
 
         def get_bool_aux(mem, a):
-            bool = set()
-
-            # UCBExpressions
-            if isinstance(a, UCBExpression):
-                if isinstance(a, UCBoolLiteral):
-                    bool.add('tt' if a.value == True else 'ff')
-                elif isinstance(a, UCNot):
-                    bool_opr = get_bool_aux(mem, a.opr)
-
-                    for b in bool_opr:
-                        if b == 'tt':
-                            bool.add('ff')
-                        else:
-                            bool.add('tt')
-                elif isinstance(a, UCAnd):
-                    bool_lhs = self.get_bool(mem, a.lhs)
-                    bool_rhs = self.get_bool(mem, a.rhs)
-
-                    for b1 in bool_lhs:
-                        for b2 in bool_rhs:
-                            if b1 == b2 and b1 == 'tt':
-                                bool.add('tt')
-                            else:
-                                bool.add('ff')
-                elif isinstance(a, UCOr):
-                    bool_lhs = self.get_bool(mem, a.lhs)
-                    bool_rhs = self.get_bool(mem, a.rhs)
-
-                    for b1 in bool_lhs:
-                        for b2 in bool_rhs:
-                            if b1 == 'tt' or b2 == 'tt':
-                                bool.add('tt')
-                            else:
-                                bool.add('ff')
-            # UCRExpressions
-            else:
-                if isinstance(a, UCEq):
-                    sign_lhs = self.get_sign(mem, a.lhs)
-                    sign_rhs = self.get_sign(mem, a.rhs)
-
-                    exit = False
-
-                    for s1 in sign_lhs:
-                        for s2 in sign_rhs:
-                            if s1 == '0' and s2 == '0':
-                                bool.add('tt')
-                            elif s1 != s2:
-                                bool.add('ff')
-                            else:
-                                bool = self.bool
-                                exit = True
-
-                                break
-
-                        if exit:
-                            break
-                elif isinstance(a, UCNeq):
-                    sign_lhs = self.get_sign(mem, a.lhs)
-                    sign_rhs = self.get_sign(mem, a.rhs)
-
-                    exit = False
-
-                    for s1 in sign_lhs:
-                        for s2 in sign_rhs:
-                            if s1 != s2:
-                                bool.add('tt')
-                            elif s1 == '0' and s2 == '0':
-                                bool.add('ff')
-                            else:
-                                bool = self.bool
-                                exit = True
-
-                                break
-
-                        if exit:
-                            break
-                elif isinstance(a, UCLt):
-                    sign_lhs = self.get_sign(mem, a.lhs)
-                    sign_rhs = self.get_sign(mem, a.rhs)
-
-                    exit = False
-
-                    for s1 in sign_lhs:
-                        for s2 in sign_rhs:
-                            if s1 == '0' and s2 == '+' or\
-                                    s1 == '-' and s2 == '+' or\
-                                    s1 == '-' and s2 == '0':
-                                bool.add('tt')
-                            elif s1 == '+' and s2 == '-' or\
-                                    s1 == '0' and s2 == '-' or\
-                                    s1 == '+' and s2 == '0' or\
-                                    s1 == s2 and s1 == '0':
-                                bool.add('ff')
-                            else:
-                                bool = self.bool
-                                exit = True
-
-                                break
-
-                        if exit:
-                            break
-                elif isinstance(a, UCLte):
-                    sign_lhs = self.get_sign(mem, a.lhs)
-                    sign_rhs = self.get_sign(mem, a.rhs)
-
-                    exit = False
-
-                    for s1 in sign_lhs:
-                        for s2 in sign_rhs:
-                            if s1 == '0' and s2 == '+' or\
-                                    s1 == '-' and s2 == '+' or\
-                                    s1 == '-' and s2 == '0' or\
-                                    s1 == s2 and s1 == '0':
-                                bool.add('tt')
-                            elif s1 == '+' and s2 == '-' or\
-                                    s1 == '+' and s2 == '0' or\
-                                    s1 == '0' and s2 == '-':
-                                bool.add('ff')
-                            else:
-                                bool = self.bool
-                                exit = True
-
-                                break
-
-                        if exit:
-                            break              
-                elif isinstance(a, UCGt):
-                    sign_lhs = self.get_sign(mem, a.lhs)
-                    sign_rhs = self.get_sign(mem, a.rhs)
-
-                    exit = False
-
-                    for s1 in sign_lhs:
-                        for s2 in sign_rhs:
-                            if s1 == '+' and s2 == '0' or\
-                                    s1 == '+' and s2 == '-' or\
-                                    s1 == '0' and s2 == '-':
-                                bool.add('tt')
-                            elif s1 == '-' and s2 == '+' or\
-                                    s1 == '0' and s2 == '+' or\
-                                    s1 == '-' and s2 == '0' or\
-                                    s1 == s2 and s1 == '0':
-                                bool.add('ff')
-                            else:
-                                bool = self.bool
-                                exit = True
-
-                                break
-
-                        if exit:
-                            break
-                elif isinstance(a, UCGte):
-                    sign_lhs = self.get_sign(mem, a.lhs)
-                    sign_rhs = self.get_sign(mem, a.rhs)
-
-                    exit = False
-
-                    for s1 in sign_lhs:
-                        for s2 in sign_rhs:
-                            if s1 == '+' and s2 == '0' or\
-                                    s1 == '+' and s2 == '-' or\
-                                    s1 == '0' and s2 == '-' or\
-                                    s1 == s2 and s1 == '0':
-                                bool.add('tt')
-                            elif s1 == '-' and s2 == '+' or\
-                                    s1 == '-' and s2 == '0' or\
-                                    s1 == '0' and s2 == '+':
-                                bool.add('ff')
-                            else:
-                                bool = self.bool
-                                exit = True
-
-                                break
-
-                        if exit:
-                            break
-
-            return bool
+            if isinstance(a, UCBoolLiteral):
+                return TT if a.value == True else FF
+            elif isinstance(a, UCNot):
+                return NOT_TABLE[get_bool_aux(mem, a.opr)]
+            elif type(a) in BOOL_TABLES:
+                return BOOL_TABLES[type(a)][
+                    self.get_bool(mem, a.lhs) << 2 | self.get_bool(mem, a.rhs)]
+            elif type(a) in REL_TABLES:
+                return REL_TABLES[type(a)][
+                    self.get_sign(mem, a.lhs) << 3 | self.get_sign(mem, a.rhs)]
+
+            return 0
 
         return get_bool_aux(mem, a)
 
-    def __aa_issubset(self, aa1, aa2):
-        """Subset extended for DS analysis domain"""
-        if not set(aa1.keys()).issubset(aa2.keys()):
-            return False
+    def domain(self, g=None):
+        actions = self.edge_keyed(g, {uv: t_uv.action
+                                      for uv, t_uv in self.transfer.items()})
 
-        for var, sign in aa1.items():
-            if var not in aa2 or not sign.issubset(aa2[var]):
-                return False
+        if self.__memo_version != self.cfg.version:
+            self.__memo.clear()
+            self.__memo_version = self.cfg.version
 
-        return True
+        memo, reads = self.__memo, {}
 
-    def __aa_union(self, aa1, aa2):
-        """Union extended for DS analysis domain"""
-        aa = aa1.copy()
+        def transfer_impl(R, u, v, e=None):
+            k = (u, v) if e is None else e
+            a = actions[k]
 
-        for var, sign in aa2.items():
-            if var not in aa:
-                aa[var] = set()
-            aa[var] = aa[var].union(sign)
+            if not isinstance(a, UCAssignment) and \
+                    not isinstance(a, UCRExpression) and \
+                    not isinstance(a, UCBExpression):
+                # TODO: Add support for UCCall
+                return None
 
-        return aa
+            if k not in reads:
+                reads[k] = self.reads(a)
 
-    def __aa_intersection(self, aa1, aa2):
-        """Intersection extended for DS analysis domain"""
-        aa = aa1.copy()
+            mask, unread = reads[k]
+            mem = R[u]
 
-        for var, sign in aa2.items():
-            if var not in aa:
-                aa[var] = set()
-            aa[var] = aa[var].intersection(sign)
+            # The scalars not read by a guard keep all of their signs, there
+            # is no basic memory if any has none
+            if not isinstance(a, UCAssignment) and \
+                    (mem | mem >> 1 | mem >> 2) & unread != unread:
+                return None
 
-        return aa
+            # Evaluations are memoized by edge and signs of the variables
+            # read by the action
+            key = k, mem & mask
+            r = memo.get(key, memo)
 
-    def __aa_complement(self, aa):
-        """Complement extended for DS analysis domain"""
-        aa_ = aa.copy()
+            if r is memo:
+                self.memo_misses += 1
+                r = self.evaluate(a, mem)
 
-        for var, sign in aa_.items():
-            aa_[var] = self.signs.difference(sign)
+                if len(memo) >= self.memo_size:
+                    del memo[next(iter(memo))]
 
-        return aa_
-
-    @property
-    def analysis_fn(self):
-        def analysis_fn_impl(R, u, v):
-            uv = self.cfg.edges[u, v]
-            a = uv['action']
+                memo[key] = r
+            else:
+                self.memo_hits += 1
 
-            # TODO: Add support for UCCall
             if isinstance(a, UCAssignment):
-                var, sign = a.lhs, self.get_sign(R[u], a.rhs)
+                var = a.lhs
 
                 if isinstance(var, UCArrayDeref):
                     var = var.lhs
                 elif isinstance(var, UCRecordDeref):
                     var = var.lhs
 
-                if R[u] != self.empty_mem:
-                    ru1 = R[u].copy()
-                    ru1[var] = sign
-                else:
-                    ru1 = self.empty_mem
-
-                if not self.__aa_issubset(ru1, R[v]):
-                    R[v] = self.__aa_union(ru1, R[v])
-                    return True
-            elif isinstance(a, UCRExpression) or isinstance(a, UCBExpression):
-                basic_mems = self.__to_basic_mem(R[u])
-
-                ru1 = self.empty_mem
+                if mem:
+                    s = self.shifts[var]
+                    return mem & ~(SIGNS << s) | r << s
 
-                for basic_mem in basic_mems:
-                    bool = self.get_bool(basic_mem, a)
+                return 0
+            elif r is not None:
+                return mem & ~mask | r & mask
 
-                    if 'tt' in bool:
-                        ru1 = self.__aa_union(ru1, basic_mem)
+            return None
 
-                if not self.__aa_issubset(ru1, R[v]):
-                    R[v] = self.__aa_union(ru1, R[v])
-                    return True
+        return UCSignsDomain(transfer_impl, self.intern)
 
-            return False
-
-        return analysis_fn_impl
-
-    def compute(self, copy=False):
+    def compute(self, copy=False, prev=None):
         ds = {}
 
         # Define the initial abstract memory
-        mem = self.initial_mem
+        mem = self.intern(self.initial_mem)
 
         # Define the initial DS assignment
+        bottom = self.domain().bottom
+
         for q in self.cfg.nodes:
-            ds[q] = self.empty_mem
+            ds[q] = bottom()
 
         # Define the initial DS assignment for the source node
         ds[self.cfg.source] = mem
 
+        # Reuse the previous solution at the unaffected nodes
+        seed = self.reuse(prev, ds)
+
         # Compute the MFP solution for DS assignments
-        ucw = UCWorklist(self.cfg, self.analysis_fn, ds, strategy=UCRRStrategy)
-        self.iters = ucw.compute()
+        self.iters = self.solve(ds, seed)
 
         if copy:
-            return ds
+            return {q: self.decode(ds_q) for q, ds_q in ds.items()}
+
+        self.bv = ds
+        self.aa = None
+
+    def decode(self, mem):
+        return {x: sign_names(mem >> 3 * i & SIGNS)
+                for i, x in enumerate(self.index.elems)}
+
+    def carry(self, prev, q):
+        mem = prev.bv[q]
+
+        if prev.index.elems != self.index.elems:
+            # Re-pack the memory for the current variables
+            mem = reduce(or_, [(mem >> 3 * i & SIGNS) << self.shifts[x]
+                               for i, x in enumerate(prev.index.elems)], 0)
+
+        return self.intern(mem)
 
-        self.aa = ds
+    def fact_record(self, ae):
+        return {'var': str(ae[0]), 'signs': sorted(ae[1])}
 
     def __str__(self):
         return super().__str__('DS', lambda ds: f'{ds[0]}: {ds[1]}')
@@ -0,0 +1,137 @@
+"""Micro-C Batch Analysis"""
+
+import glob
+import json
+import os
+import sys
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .parse import parse
+from .cfg import UCProgramGraph
+from .analysis import *
+from .report import analysis_records, error_records
+
+
+def find_sources(paths):
+    """Expand files, directories (searched recursively for `.uc` files) and
+    glob patterns into a sorted list of source files"""
+    src_files = set()
+
+    for path in paths:
+        if os.path.isdir(path):
+            src_files.update(glob.glob(os.path.join(path, '**', '*.uc'),
+                                       recursive=True))
+        elif glob.has_magic(path):
+            src_files.update(f for f in glob.glob(path, recursive=True)
+                             if os.path.isfile(f))
+        else:
+            src_files.add(path)
+
+    return sorted(src_files)
+
+
+def analyze_file(src_file, output='text', cache=None):
+    """Run every analysis on a source file, reusing the results in `cache`
+    (a `UCResultCache`) if any. Returns the source file, the reports of the
+    analyses (as JSON lines if `output` is 'jsonl') and the error which
+    stopped them, if any"""
+    try:
+        with open(src_file, 'r') as f:
+            src = f.read()
+
+        compact = cache.load(src, 'cfg') if cache is not None else None
+
+        if compact is not None:
+            cfg = UCProgramGraph.from_compact(compact)
+        else:
+            ast = cache.load(src, 'ast') if cache is not None else None
+
+            if ast is None:
+                ast = parse(src)
+
+                if cache is not None:
+                    cache.store(src, 'ast', ast)
+
+            cfg = UCProgramGraph()
+            cfg = cfg.compute(ast)
+
+            if cache is not None:
+                cache.store(src, 'cfg', cfg.to_compact())
+
+        reports = []
+
+        for analysis in (UCReachingDefs, UCLiveVars,
+                         UCDangerousVars, UCDetectionSigns):
+            aa = analysis(cfg)
+            result = cache.load(src, analysis.__name__)\
+                if cache is not None else None
+
+            if result is not None:
+                aa.result = result
+            else:
+                aa.compute()
+
+                if cache is not None:
+                    cache.store(src, analysis.__name__, aa.result)
+
+            if output == 'jsonl':
+                reports.extend(json.dumps(record, ensure_ascii=False)
+                               for record in analysis_records(aa, file=src_file))
+            else:
+                reports.append(str(aa))
+
+        return src_file, reports, None
+    except Exception as e:
+        reports = None
+
+        if output == 'jsonl':
+            reports = [json.dumps(record, ensure_ascii=False)
+                       for record in error_records(e, file=src_file)]
+
+        return src_file, reports, f'{type(e).__name__}: {e}'
+
+
+def run_batch(paths, jobs=None, output='text', cache=None):
+    """Analyze the sources in `paths` in a process pool, printing the reports
+    as they complete, and reusing the results in `cache` if any. Returns the
+    number of sources which failed"""
+    src_files = find_sources(paths)
+    failed = 0
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(analyze_file, f, output, cache)
+                   for f in src_files]
+
+        try:
+            for future in as_completed(futures):
+                src_file, reports, error = future.result()
+
+                if output == 'jsonl':
+                    if error is not None:
+                        failed += 1
+
+                    print('\n'.join(reports))
+                    sys.stdout.flush()
+                    continue
+
+                print(f'==> {src_file} <==')
+
+                if error is not None:
+                    failed += 1
+                    print(f'error: {error}\n')
+                else:
+                    print('\n'.join(reports))
+
+                sys.stdout.flush()
+        except BrokenPipeError:
+            # Nobody reads the reports anymore, skip the pending sources
+            for future in futures:
+                future.cancel()
+
+            raise
+
+    print(f'{len(src_files)} source(s) analyzed, {failed} failed.',
+          file=sys.stderr)
+
+    return failed
@@ -0,0 +1,274 @@
+"""Persistent Analysis Result Cache"""
+
+import functools
+import hashlib
+import hmac
+import json
+import os
+import pickle
+import tempfile
+import zlib
+
+
+# Header of the cache entries, bumped when their layout changes
+MAGIC = b'UCC2'
+
+# Packages whose sources make up the analyzer
+PACKAGES = ('lang', 'utils', 'passes', os.path.join('passes', 'internal'))
+
+# Files of the cache directory which are not entries
+SIZE_FILE = '.size'
+VERSION_FILE = '.version'
+
+
+def analyzer_sources():
+    """Paths of the analyzer sources, in a stable order"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    paths = []
+
+    for pkg in PACKAGES:
+        pkg_dir = os.path.join(root, pkg)
+
+        for name in sorted(os.listdir(pkg_dir)):
+            if name.endswith('.py'):
+                paths.append(os.path.join(pkg, name))
+
+    return root, paths
+
+
+def analyzer_stat():
+    """Digest of the size and modification time of the analyzer sources,
+    which changes whenever any of them may have"""
+    root, paths = analyzer_sources()
+    h = hashlib.sha256(MAGIC)
+
+    for path in paths:
+        stat = os.stat(os.path.join(root, path))
+        h.update(f'{path}:{stat.st_size}:{stat.st_mtime_ns};'.encode())
+
+    return h.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def analyzer_version():
+    """Fingerprint of the analyzer sources, so that cached results are never
+    reused across changes to the parser, the program graph or the analyses.
+    Computed once per process"""
+    root, paths = analyzer_sources()
+    h = hashlib.sha256(MAGIC)
+
+    for path in paths:
+        with open(os.path.join(root, path), 'rb') as f:
+            h.update(path.encode())
+            h.update(f.read())
+
+    return h.hexdigest()
+
+
+def default_secret():
+    """Key of the cache entries: `UC_CACHE_SECRET` if set, or else a random
+    key created on first use in `~/.uc-cache-key`, readable by its owner
+    only"""
+    secret = os.environ.get('UC_CACHE_SECRET')
+
+    if secret:
+        return secret.encode()
+
+    path = os.path.join(os.path.expanduser('~'), '.uc-cache-key')
+
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        with open(path, 'rb') as f:
+            return f.read()
+
+    secret = os.urandom(32)
+
+    with os.fdopen(fd, 'wb') as f:
+        f.write(secret)
+
+    return secret
+
+
+class UCResultCache:
+    """Content-addressed cache of the AST, program graph and analysis results
+    of a source, bounded to `max_bytes` by evicting the least recently used
+    entries. Entries are zlib-compressed pickles
+
+    Unpickling runs code, so entries are signed with an HMAC of `secret`
+    (see `default_secret`) and those which do not verify are ignored. The
+    cache directory may be shared with untrusted writers, the secret must
+    not: anyone holding it can make the analyzer run code. Caches shared
+    across CI runs should get their secret from `UC_CACHE_SECRET`.
+
+    The size of the entries is kept in an index file, and the directory is
+    only scanned when the bound is exceeded.
+    """
+
+    def __init__(self, cache_dir, max_bytes=256 * 2**20, secret=None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.secret = secret if secret is not None else default_secret()
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self.version = self.load_version()
+        self.size = self.load_size()
+
+    def sign(self, payload):
+        return MAGIC + hmac.digest(self.secret, payload, 'sha256') + payload
+
+    def verify(self, data):
+        """Payload of the signed `data`, or None if it does not verify"""
+        n = len(MAGIC) + hashlib.sha256().digest_size
+        digest, payload = data[len(MAGIC):n], data[n:]
+
+        if not data.startswith(MAGIC) or not hmac.compare_digest(
+                digest, hmac.digest(self.secret, payload, 'sha256')):
+            return None
+
+        return payload
+
+    def write(self, path, data):
+        # Write to a temporary file first, concurrent readers never see a
+        # partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+
+        os.replace(tmp_path, path)
+
+    def load_version(self):
+        """Analyzer version, read from the version file of the cache if the
+        analyzer sources did not change since it was written"""
+        path = os.path.join(self.cache_dir, VERSION_FILE)
+        stat = analyzer_stat()
+
+        try:
+            with open(path, 'rb') as f:
+                payload = self.verify(f.read())
+
+            stamp = json.loads(payload) if payload is not None else {}
+
+            if stamp.get('stat') == stat:
+                return stamp['version']
+        except (OSError, ValueError, KeyError):
+            pass
+
+        version = analyzer_version()
+        self.write(path, self.sign(json.dumps(
+            {'stat': stat, 'version': version}).encode()))
+
+        return version
+
+    def load_size(self):
+        """Size of the entries, from the size file of the cache"""
+        try:
+            with open(os.path.join(self.cache_dir, SIZE_FILE), 'r') as f:
+                return int(f.read())
+        except (OSError, ValueError):
+            return 0
+
+    def store_size(self):
+        self.write(os.path.join(self.cache_dir, SIZE_FILE),
+                   str(self.size).encode())
+
+    def key(self, src, name):
+        h = hashlib.sha256()
+
+        # Fields are length-prefixed, so that no two (name, src) pairs hash
+        # the same bytes
+        for field in (self.version, name, src):
+            data = field.encode()
+            h.update(len(data).to_bytes(8, 'little'))
+            h.update(data)
+
+        return h.hexdigest()
+
+    def path(self, src, name):
+        return os.path.join(self.cache_dir, self.key(src, name))
+
+    def load(self, src, name):
+        """Cached value of `name` for `src`, or None"""
+        path = self.path(src, name)
+
+        try:
+            with open(path, 'rb') as f:
+                payload = self.verify(f.read())
+
+            if payload is None:
+                raise ValueError(f'{path}: not a cache entry')
+
+            value = pickle.loads(zlib.decompress(payload))
+
+            # Mark the entry as recently used
+            os.utime(path)
+        except (OSError, ValueError, zlib.error, pickle.UnpicklingError,
+                EOFError, AttributeError, RecursionError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+
+        return value
+
+    def store(self, src, name, value):
+        """Cache `value` as `name` for `src`. Values which cannot be pickled
+        (e.g. too deeply nested) are not cached"""
+        try:
+            data = self.sign(zlib.compress(
+                pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)))
+        except (pickle.PicklingError, RecursionError, TypeError):
+            return False
+
+        path = self.path(src, name)
+
+        try:
+            self.size -= os.stat(path).st_size
+        except OSError:
+            pass
+
+        self.write(path, data)
+
+        self.size += len(data)
+
+        # Evict down to 3/4 of the bound, so that the directory is only
+        # scanned once every many stores
+        if self.size > self.max_bytes:
+            self.evict(self.max_bytes * 3 // 4)
+
+        self.store_size()
+
+        return True
+
+    def evict(self, max_bytes=None):
+        """Remove the least recently used entries until the cache fits in
+        `max_bytes` (the bound of the cache by default)"""
+        max_bytes = max_bytes if max_bytes is not None else self.max_bytes
+        entries = []
+        size = 0
+
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and not entry.name.startswith('.') and \
+                    not entry.name.endswith('.tmp'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path,))
+                size += stat.st_size
+
+        entries.sort()
+
+        for _, entry_size, path in entries:
+            if size <= max_bytes:
+                break
+
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+            size -= entry_size
+
+        self.size = size
@@ -1,12 +1,17 @@
 """Micro-C Control-flow/Program Graph Generation"""
 import networkx as nx
 
+from array import array
+
 from lang.ast import *
 from lang.types import *
 from lang.ops import *
 
 from utils.decorators import classproperty
 
+from .internal.bitvector import UCBitVector
+from .internal.dfst import UCSpanTree
+
 
 class UCProgramGraph(nx.DiGraph):
     class NodeType:
@@ -14,11 +19,23 @@ class UCProgramGraph(nx.DiGraph):
         sink = 'sink'
 
     def __init__(self, data=None, **attr):
+        # Bumped on every structural change and when `vars` is assigned,
+        # used to invalidate the caches derived from the graph. Edge actions
+        # and the `vars` dict edited in place do not bump it: replace the
+        # action with `add_edge`, or call `invalidate`
+        self.version = 0
+
         super().__init__(data, **attr)
 
         self.sources = []
         self.sinks = []
         self.vars = {}
+        self._var_index = None
+        self._var_index_version = None
+        self._rp = None
+        self._rp_version = None
+        self._frozen = None
+        self._frozen_version = None
 
     @classproperty
     def empty(cls):
@@ -32,8 +49,86 @@ class UCProgramGraph(nx.DiGraph):
     def sink(self):
         return self.sinks[0] if len(self.sinks) > 0 else None
 
+    @property
+    def vars(self):
+        return self._vars
+
+    @vars.setter
+    def vars(self, vars):
+        self._vars = vars
+        self.version += 1
+
+    @property
+    def var_index(self):
+        """Interned (dense) index of the program variables, recomputed only
+        when the graph or its variables change"""
+        if self._var_index is None or self._var_index_version != self.version:
+            self._var_index = UCBitVector(self.vars)
+            self._var_index_version = self.version
+
+        return self._var_index
+
+    @property
+    def rp(self):
+        """Reverse-postorder numbering of the nodes reachable from the source,
+        recomputed only when the graph changes"""
+        if self._rp is None or self._rp_version != self.version:
+            self._rp = UCSpanTree.dfs_rp(self)\
+                if self.source is not None else {}
+            self._rp_version = self.version
+
+        return self._rp
+
+    def invalidate(self):
+        """Invalidate the caches derived from the graph (transfer summaries,
+        variable index, reverse postorder and frozen snapshot), after the
+        edge actions or the `vars` dict were edited in place"""
+        self.version += 1
+
+    def freeze(self):
+        """Array-backed snapshot of the graph (see `UCFrozenProgramGraph`),
+        rebuilt only when the graph changes"""
+        if self._frozen is None or self._frozen_version != self.version:
+            self._frozen = UCFrozenProgramGraph(self)
+            self._frozen_version = self.version
+
+        return self._frozen
+
+    def to_compact(self):
+        """Picklable form of the graph made of plain lists, keeping the
+        edge actions, sources, sinks and vars (see `from_compact`)"""
+        return (list(self.nodes),
+                [(u, v, attr['action']) for u, v, attr in self.edges(data=True)],
+                self.sources, self.sinks, self.vars,)
+
+    @staticmethod
+    def from_compact(compact):
+        nodes, edges, sources, sinks, vars = compact
+
+        g = UCProgramGraph()
+
+        for n in nodes:
+            g.add_node(n, type=UCProgramGraph.NodeType.source if n in sources
+                       else UCProgramGraph.NodeType.sink if n in sinks
+                       else None)
+
+        for u, v, action in edges:
+            g.add_edge(u, v, action=action)
+
+        g.vars = vars
+
+        return g
+
     def reverse(self, copy=True):
-        reversed = super().reverse(copy=copy)
+        if copy:
+            # The edge actions are shared, not deep-copied as by networkx
+            reversed = self.__class__()
+            reversed.graph.update(self.graph)
+            reversed.add_nodes_from((n, d.copy()) for n, d in self.nodes.items())
+            reversed.add_edges_from((v, u, d.copy())
+                                    for u, v, d in self.edges(data=True))
+        else:
+            reversed = super().reverse(copy=copy)
 
         sources_tmp = self.sources
         reversed.sources = self.sinks.copy() if copy else self.sinks
@@ -51,309 +146,393 @@ class UCProgramGraph(nx.DiGraph):
         if 'selector' not in attr:
             attr['selector'] = None
 
+        self.version += 1
+
         return super().add_node(node, **attr)
 
+    def add_nodes_from(self, nodes_for_adding, **attr):
+        self.version += 1
+
+        return super().add_nodes_from(nodes_for_adding, **attr)
+
     def remove_node(self, n):
         super().remove_node(n)
 
+        self.version += 1
+
         if n in self.sources:
             self.sources.remove(n)
         if n in self.sinks:
             self.sinks.remove(n)
 
-    @staticmethod
-    def union(g, h):
-        g_out = nx.union(g, h)
-        g_out.sources = g.sources.copy()
-        g_out.sinks = g.sinks.copy()
-        g_out.vars = g.vars.copy()
-        g_out.sources.extend(h.sources.copy())
-        g_out.sinks.extend(h.sinks.copy())
-        g_out.vars.update(h.vars)
+    def remove_nodes_from(self, nodes):
+        self.version += 1
 
-        return g_out
+        return super().remove_nodes_from(nodes)
 
-    @staticmethod
-    def try_union(g, h):
-        try:
-            return UCProgramGraph.union(g, h)
-        except:
-            return None
+    def add_edge(self, u_of_edge, v_of_edge, **attr):
+        self.version += 1
 
-    @staticmethod
-    def join(gs, sources_keep=None):
-        if len(gs) == 0:
-            return UCProgramGraph.empty
+        return super().add_edge(u_of_edge, v_of_edge, **attr)
 
-        if sources_keep == None:
-            sources_keep = []
+    def add_edges_from(self, ebunch_to_add, **attr):
+        self.version += 1
 
-        g_out = gs[0]
+        return super().add_edges_from(ebunch_to_add, **attr)
 
-        g_out_sink_del_list = []
-        g_source_del_list = []
+    def remove_edge(self, u, v):
+        self.version += 1
 
-        for g in gs[1:]:
-            g_out_sink_edges = list(g_out.in_edges(g_out.sinks, data=True))
-            g_source_edges = list(g.out_edges(g.sources, data=True))
+        return super().remove_edge(u, v)
 
-            g_out_ = UCProgramGraph.try_union(g_out, g)
+    def remove_edges_from(self, ebunch):
+        self.version += 1
 
-            if g_out_ != None:
-                g_out = g_out_
+        return super().remove_edges_from(ebunch)
 
-            for u, v, attr_uv in g_out_sink_edges:
-                for x, _, _ in g_source_edges:
-                    if g_out.nodes[v]['selector'] == g.nodes[x]['selector']:
-                        if g_out.has_edge(u, v):
-                            g_out.remove_edge(u, v)
-                            g_out_sink_del_list.append(v)
+    def compute(self, ast, copy=True):
+        g_out = UCProgramGraphBuilder().build(ast)
 
-                        g_out.add_edge(u, x, **attr_uv)
+        # Return g_out if copy=True
+        if copy:
+            return g_out
 
-                        if x not in g_source_del_list:
-                            g_source_del_list.append(x)
+        # Else, update result in place
+        self.clear()
+        self.add_nodes_from(g_out.nodes(data=True))
+        self.add_edges_from(g_out.edges(data=True))
+        self.sources = g_out.sources
+        self.sinks = g_out.sinks
+        self.vars = g_out.vars
 
-        for n in g_out_sink_del_list:
-            g_out.remove_node(n)
+    def __eq__(self, other):
+        if isinstance(other, UCProgramGraph):
+            return self.sources == other.sources and \
+                self.sinks == other.sinks and \
+                super.__eq__(self, other)
 
-        for n in g_source_del_list:
-            if n not in sources_keep:
-                g_out.sources.remove(n)
-                g_out.nodes[n]['type'] = None
+        return False
 
-        return g_out
+    def __str__(self):
+        dfs_edges = nx.edge_dfs(self, source=self.sources[0])
 
-    def stitch_sinks(self):
-        sink_remove_list = []
-        edge_add_list = []
+        return ''.join(f'{x} {y} => {self.edges[x, y]["action"]}\n'
+                       for x, y in dfs_edges)
 
-        for sink in self.sinks[1:]:
-            for u in self.predecessors(sink):
-                attrs = self.edges[(u, sink)]
-                sink_remove_list.append(sink)
-                edge_add_list.append((u, self.sink, attrs,))
+    def to_dot(self):
+        """DOT source of the graph, with the edges labelled by their actions"""
+        def quote(x): return '"' + str(x).replace('\\', '\\\\')\
+            .replace('"', '\\"') + '"'
 
-        for sink in sink_remove_list:
-            self.remove_node(sink)
-        for u, v, attrs in edge_add_list:
-            self.add_edge(u, v, **attrs)
+        lines = ['digraph {', '\tnodesep=3;']
+        lines.extend(f'\t{quote(q)};' for q in self.nodes)
+        lines.extend(f'\t{quote(u)} -> {quote(v)} [label={quote(action)}];'
+                     for u, v, action in self.edges(data='action'))
+        lines.append('}\n')
 
-    def compute(self, ast, copy=True):
-        node_id = 0
+        return '\n'.join(lines)
 
-        def get_node_id(node):
-            nonlocal node_id
+    def draw(self, src_file, max_nodes=None):
+        """Write the graph to `<src_file>.dot` and render it to SVG. Graphs
+        with more than `max_nodes` nodes are not drawn. Returns the path of
+        the `.dot` file, or None if the graph was not drawn"""
+        if max_nodes is not None and len(self) > max_nodes:
+            return None
 
-            node_id += 1
-            return f'{node_id}'
+        import graphviz as gv
 
-        def compute_aux(node):
-            if isinstance(node, UCProgram):
-                assert len(node.blocks) == 1
-                return compute_aux(node.blocks[0])
+        from pathlib import Path
 
-            if isinstance(node, UCBlock):
-                stmts_g = compute_aux(node.stmts)
+        dot_file = f'{Path(src_file).name.split(".")[0]}.dot'
 
-                # Stitch sinks
-                if not isinstance(node, UCNestedBlock):
-                    stmts_g.stitch_sinks()
+        # Generate .dot
+        with open(dot_file, 'w', encoding='utf-8') as f:
+            f.write(self.to_dot())
+
+        # Render CFG
+        gv.render('dot', 'svg', dot_file)
 
-                return UCProgramGraph.union(compute_aux(node.decls), stmts_g)
+        return dot_file
 
-            if isinstance(node, UCDeclarations):
-                return UCProgramGraph.join(list(map(compute_aux, node.decls)))
-
-            if isinstance(node, UCStatements):
-                assert len(node.stmts) > 0
-                return UCProgramGraph.join(list(map(compute_aux, node.stmts)))
 
-            if isinstance(node, UCDeclaration):
-                g = UCProgramGraph.empty
-                g.vars[node.id] = node
-
-                return g
+class UCFrozenProgramGraph:
+    """Immutable, array-backed (CSR) snapshot of a program graph
 
-            if isinstance(node, UCStatement):
-                if isinstance(node, UCAssignment):
-                    qi = get_node_id(node)
-                    qf = get_node_id(node)
-
-                    g = UCProgramGraph.empty
-                    g.add_node(qi, type=UCProgramGraph.NodeType.source)
-                    g.add_node(qf, type=UCProgramGraph.NodeType.sink)
-                    g.add_edge(qi, qf, action=node)
+    Nodes are the ids 0..n-1 of the labels in `labels`. The successors of
+    `u` are `succ[succ_offsets[u]:succ_offsets[u + 1]]`, and the position of
+    an edge in `succ` is its id, which indexes `actions`. Predecessors are
+    laid out the same way, with the id of the edge they come from in
+    `pred_edges`.
+    """
 
-                    return g
+    def __init__(self, cfg):
+        self.labels = list(cfg.nodes)
+        self.ids = {q: i for i, q in enumerate(self.labels)}
+        self.source = self.ids.get(cfg.source)
+        self.sink = self.ids.get(cfg.sink)
+        self.vars = cfg.vars
+        self.succ_offsets = array('l', [0])
+        self.succ = array('l')
+        self.actions = []
 
-                if isinstance(node, UCCall):
-                    qi = get_node_id(node)
-                    qf = get_node_id(node)
+        for u in self.labels:
+            for v, uv in cfg.succ[u].items():
+                self.succ.append(self.ids[v])
+                self.actions.append(uv['action'])
 
-                    g = UCProgramGraph.empty
-                    g.add_node(qi, type=UCProgramGraph.NodeType.source)
-                    g.add_node(qf, type=UCProgramGraph.NodeType.sink)
-                    g.add_edge(qi, qf, action=node)
+            self.succ_offsets.append(len(self.succ))
 
-                    return g
+        # Bucket the edges by target
+        n, m = len(self.labels), len(self.succ)
+        self.pred_offsets = array('l', [0] * (n + 1))
 
-                if isinstance(node, UCIf):
-                    if_expr = node.b_expr
-                    if_body = node.block
-                    not_if_expr = UCNot(if_expr)
+        for v in self.succ:
+            self.pred_offsets[v + 1] += 1
 
-                    qi = get_node_id(node)
-                    qf_if = get_node_id(if_expr)
-                    qf_not_if = get_node_id(not_if_expr)
+        for i in range(n):
+            self.pred_offsets[i + 1] += self.pred_offsets[i]
 
-                    g = UCProgramGraph.empty
-                    g.add_node(qi, type=UCProgramGraph.NodeType.source)
-                    g.add_node(
-                        qf_if, type=UCProgramGraph.NodeType.sink, selector='if')
-                    g.add_node(qf_not_if, type=UCProgramGraph.NodeType.sink)
-                    g.add_edge(qi, qf_if, action=if_expr)
-                    g.add_edge(qi, qf_not_if, action=not_if_expr)
+        self.pred = array('l', [0] * m)
+        self.pred_edges = array('l', [0] * m)
+        fill = self.pred_offsets[:-1]
 
-                    g_if_body = compute_aux(if_body)
-                    g_if_body.nodes[g_if_body.sources[0]]['selector'] = 'if'
+        for u in range(n):
+            for e in range(self.succ_offsets[u], self.succ_offsets[u + 1]):
+                v = self.succ[e]
+                self.pred[fill[v]] = u
+                self.pred_edges[fill[v]] = e
+                fill[v] += 1
+
+        self._rp = {self.ids[q]: k for q, k in cfg.rp.items()}
+
+    @property
+    def nodes(self):
+        return range(len(self.labels))
 
-                    return UCProgramGraph.join([g, g_if_body])
+    @property
+    def rp(self):
+        """Reverse-postorder numbering of the nodes reachable from the source"""
+        return self._rp
 
-                if isinstance(node, UCIfElse):
-                    if_expr = node.b_expr
-                    if_body = node.if_block
-                    else_expr = UCNot(if_expr)
-                    else_body = node.else_block
+    def successors(self, u):
+        return self.succ[self.succ_offsets[u]:self.succ_offsets[u + 1]]
 
-                    qi = get_node_id(node)
-                    qf_if = get_node_id(if_expr)
-                    qf_else = get_node_id(else_expr)
+    def predecessors(self, v):
+        return self.pred[self.pred_offsets[v]:self.pred_offsets[v + 1]]
 
-                    g = UCProgramGraph.empty
-                    g.add_node(qi, type=UCProgramGraph.NodeType.source)
-                    g.add_node(
-                        qf_if, type=UCProgramGraph.NodeType.sink, selector='if')
-                    g.add_node(
-                        qf_else, type=UCProgramGraph.NodeType.sink, selector='else')
-                    g.add_edge(qi, qf_if, action=if_expr)
-                    g.add_edge(qi, qf_else, action=else_expr)
+    def edges(self):
+        """Generator over the (u, v) edges, in edge id order"""
+        for u in self.nodes:
+            for e in range(self.succ_offsets[u], self.succ_offsets[u + 1]):
+                yield u, self.succ[e]
 
-                    g_if_body = compute_aux(if_body)
-                    g_else_body = compute_aux(else_body)
+    def __len__(self):
+        return len(self.labels)
 
-                    g_if_body.nodes[g_if_body.sources[0]]['selector'] = 'if'
-                    g_else_body.nodes[g_else_body.sources[0]
-                                      ]['selector'] = 'else'
-                    g_out = UCProgramGraph.join([g, g_if_body, g_else_body])
+    def __iter__(self):
+        return iter(self.nodes)
 
-                    return g_out
+    def __contains__(self, u):
+        return isinstance(u, int) and 0 <= u < len(self.labels)
 
-                if isinstance(node, UCWhile):
-                    while_expr = node.b_expr
-                    while_body = node.block
-                    not_while_expr = UCNot(while_expr)
+    def __getitem__(self, u):
+        return self.successors(u)
 
-                    qi = get_node_id(node)
-                    qf_while = get_node_id(while_expr)
-                    qf_not_while = get_node_id(not_while_expr)
 
-                    g = UCProgramGraph.empty
-                    g.add_node(
-                        qi, type=UCProgramGraph.NodeType.source, selector='while')
-                    g.add_node(
-                        qf_while, type=UCProgramGraph.NodeType.sink, selector='while')
-                    g.add_node(qf_not_while, type=UCProgramGraph.NodeType.sink)
-                    g.add_edge(qi, qf_while, action=while_expr)
-                    g.add_edge(qi, qf_not_while, action=not_while_expr)
+class UCProgramGraphBuilder:
+    """Single-pass Program Graph construction
 
-                    g_while_body = compute_aux(while_body)
+    Nodes and edges are emitted into one graph while walking the AST, and
+    the sinks of each statement are merged into the source of the next one
+    in place, without copying the graphs of the statements.
+    """
 
-                    if g_while_body != UCProgramGraph.empty:
-                        g_while_body.nodes[g_while_body.sources[0]
-                                           ]['selector'] = 'while'
-                        for s in g_while_body.sinks:
-                            g_while_body.nodes[s]['selector'] = 'while'
+    def __init__(self):
+        self.g = nx.DiGraph()
+        self.vars = {}
+        self.selectors = {}
+        self.node_id = 0
 
-                    g_out = UCProgramGraph.join(
-                        [g, g_while_body, g], sources_keep=[qi])
+    def add_node(self, selector=None):
+        self.node_id += 1
+        self.g.add_node(self.node_id)
+        self.selectors[self.node_id] = selector
 
-                    # Make the source node available again
-                    g_out.nodes[qi]['selector'] = None
+        return self.node_id
 
-                    return g_out
+    def merge(self, s, x):
+        """Redirect the incoming edges of the sink `s` to `x`, then remove `s`"""
+        for u, _, attr in list(self.g.in_edges(s, data=True)):
+            self.g.add_edge(u, x, **attr)
 
-            return UCProgramGraph.empty
+        self.g.remove_node(s)
 
-        g_out = compute_aux(ast)
+    def build(self, ast):
+        source, sinks = self.build_aux(ast)
 
         # Relabel
-        nodes = list(map(str, sorted(list(map(int, g_out.nodes)))))
-        nodes = list(
-            filter(lambda n: n not in g_out.sources + g_out.sinks, nodes))
+        nodes = sorted(self.g.nodes)
+        nodes.remove(source)
+        nodes.remove(sinks[0])
 
-        relabel_map = {g_out.sources[0]: '▷', g_out.sinks[0]: '◀'}
-        relabel_map.update({n_: n for n_, n in zip(
-            nodes, list(range(1, len(nodes) + 1)))})
+        relabel_map = {source: '▷', sinks[0]: '◀'}
+        relabel_map.update({n_: n for n, n_ in enumerate(nodes, start=1)})
 
-        nx.relabel_nodes(g_out, relabel_map, copy=False)
+        g_out = UCProgramGraph()
+        g_out.add_node('▷', type=UCProgramGraph.NodeType.source,
+                       selector=self.selectors[source])
 
-        # Return g_out if copy=True
-        if copy:
-            return g_out
+        for n_ in nodes:
+            g_out.add_node(relabel_map[n_], type=None,
+                           selector=self.selectors[n_])
 
-        # Else, update result in place
-        # TODO: Refactor with move semantics
-        self.edges = g_out.edges
-        self.nodes = g_out.nodes
-        self.sources = g_out.sources
-        self.sinks = g_out.sinks
-        self.vars = g_out.vars
+        g_out.add_node('◀', type=UCProgramGraph.NodeType.sink,
+                       selector=self.selectors[sinks[0]])
 
-    def __eq__(self, other):
-        if isinstance(other, UCProgramGraph):
-            return self.sources == other.sources and \
-                self.sinks == other.sinks and \
-                super.__eq__(self, other)
+        for u, v, attr in self.g.edges(data=True):
+            g_out.add_edge(relabel_map[u], relabel_map[v], **attr)
 
-        return False
+        g_out.vars = self.vars
 
-    def __str__(self):
-        s = ''
-        dfs_edges = nx.edge_dfs(self, source=self.sources[0])
+        return g_out
 
-        for e in dfs_edges:
-            x = e[0]
-            y = e[1]
-            action = self.get_edge_data(*e)['action']
-            s += f'{x} {y} => {action}\n'
+    def build_aux(self, root):
+        """Build the graph of `root`, returning its source and sinks
 
-        return s
+        Nested nodes are built through an explicit stack of `build_node`
+        generators rather than by recursion, so the nesting depth of the
+        program is not bounded by the Python stack.
+        """
+        stack = [self.build_node(root)]
+        result = None
 
-    def draw(self, src_file):
-        import os
-        import graphviz as gv
+        while stack:
+            try:
+                child = stack[-1].send(result)
+            except StopIteration as e:
+                stack.pop()
+                result = e.value
+            else:
+                stack.append(self.build_node(child))
+                result = None
 
-        from pathlib import Path
-        from importlib import reload
-        from networkx.drawing.nx_pydot import to_pydot
+        return result
 
-        for _, _, attr in self.edges(data=True):
-            attr['label'] = attr['action']
+    def build_node(self, node):
+        """Generator building the graph of `node`, which yields the child
+        nodes to be built and receives their source and sinks"""
+        if isinstance(node, UCProgram):
+            assert len(node.blocks) == 1
+            return (yield node.blocks[0])
 
-        src_file = Path(src_file).name.split('.')[0]
+        if isinstance(node, UCBlock):
+            source, sinks = yield node.stmts
 
-        # Remove CFG files if existing
-        try:
-            os.remove(f'{src_file}.dot')
-            os.remove(f'{src_file}.dot.png')
-        except:
-            pass
+            if node.decls is not None:
+                yield node.decls
 
-        # Generate .dot
-        cfg_dot = to_pydot(self)
-        cfg_dot.set('nodesep', 3)
-        cfg_dot.write(f'{src_file}.dot', prog='dot', encoding='utf-8')
+            # Stitch sinks
+            if not isinstance(node, UCNestedBlock):
+                for s in sinks[1:]:
+                    self.merge(s, sinks[0])
+
+                sinks = sinks[:1]
+
+            return source, sinks
+
+        if isinstance(node, UCDeclarations):
+            for decl in node.decls:
+                self.vars[decl.id] = decl
+
+            return None, []
+
+        if isinstance(node, UCStatements):
+            assert len(node.stmts) > 0
+
+            stmts = []
+
+            for stmt in node.stmts:
+                stmts.append((yield stmt))
+
+            source, sinks = stmts[0]
+
+            for stmt_source, stmt_sinks in stmts[1:]:
+                for s in sinks:
+                    self.merge(s, stmt_source)
+
+                sinks = stmt_sinks
+
+            return source, sinks
+
+        if isinstance(node, UCAssignment) or isinstance(node, UCCall):
+            qi = self.add_node()
+            qf = self.add_node()
+
+            self.g.add_edge(qi, qf, action=node)
+
+            return qi, [qf]
+
+        if isinstance(node, UCIf):
+            if_expr = node.b_expr
+            not_if_expr = UCNot(if_expr)
+
+            qi = self.add_node()
+            qf_if = self.add_node(selector='if')
+            qf_not_if = self.add_node()
+
+            self.g.add_edge(qi, qf_if, action=if_expr)
+            self.g.add_edge(qi, qf_not_if, action=not_if_expr)
+
+            if_source, if_sinks = yield node.block
+            self.selectors[if_source] = 'if'
+            self.merge(qf_if, if_source)
+
+            return qi, [qf_not_if] + if_sinks
+
+        if isinstance(node, UCIfElse):
+            if_expr = node.b_expr
+            else_expr = UCNot(if_expr)
+
+            qi = self.add_node()
+            qf_if = self.add_node(selector='if')
+            qf_else = self.add_node(selector='else')
+
+            self.g.add_edge(qi, qf_if, action=if_expr)
+            self.g.add_edge(qi, qf_else, action=else_expr)
+
+            if_source, if_sinks = yield node.if_block
+            else_source, else_sinks = yield node.else_block
+
+            self.selectors[if_source] = 'if'
+            self.selectors[else_source] = 'else'
+            self.merge(qf_if, if_source)
+            self.merge(qf_else, else_source)
+
+            return qi, if_sinks + else_sinks
+
+        if isinstance(node, UCWhile):
+            while_expr = node.b_expr
+            not_while_expr = UCNot(while_expr)
+
+            qi = self.add_node(selector='while')
+            qf_while = self.add_node(selector='while')
+            qf_not_while = self.add_node()
+
+            self.g.add_edge(qi, qf_while, action=while_expr)
+            self.g.add_edge(qi, qf_not_while, action=not_while_expr)
+
+            while_source, while_sinks = yield node.block
+            self.selectors[while_source] = 'while'
+            self.merge(qf_while, while_source)
+
+            # Loop back to the condition
+            for s in while_sinks:
+                self.merge(s, qi)
+
+            # Make the source node available again
+            self.selectors[qi] = None
+
+            return qi, [qf_not_while]
+
+        return None, []
 
-        # Render CFG
-        gv.render('dot', 'svg', f'{src_file}.dot')
@@ -1,16 +1,24 @@
 from lang.types import *
 from lang.ops import *
 
-declarations = {}
-errors = []
+class UCParseError(Exception):
+    """Micro-C syntax and semantic errors, as a list of (line, message) pairs"""
 
-def check_redeclaration(lineno, var_name):
-    if var_name in declarations:
-        print('errors:')
-        print('\tline {}: cannot redeclare `{}`'.format(lineno, var_name))
-        exit(1)
+    def __init__(self, errors):
+        super().__init__(errors)
+        self.errors = errors
+
+    def __str__(self):
+        return '\n'.join('In line {}: {}'.format(lineno, error)
+                         for lineno, error in self.errors)
+
+def check_redeclaration(ctx, lineno, var_name):
+    if var_name in ctx.declarations:
+        raise UCParseError([(lineno, 'cannot redeclare `{}`'.format(var_name))])
+
+def check_semantics(ctx, lineno, value):
+    declarations, errors = ctx.declarations, ctx.errors
 
-def check_semantics(lineno, value):
     lvalue = value.lhs
     rvalue = value.rhs
 
@@ -44,12 +52,14 @@ def check_semantics(lineno, value):
         if isinstance(lvalue, UCArrayDeref) and not isinstance(variable, UCArray):
             errors.append((lineno, 'cannot assign an expression, `{}` is not an array'.format(identifier)))
 
-    __check_rvalue(lineno, rvalue)
+    __check_rvalue(ctx, lineno, rvalue)
+
+def __check_rvalue(ctx, lineno, rvalue):
+    declarations, errors = ctx.declarations, ctx.errors
 
-def __check_rvalue(lineno, rvalue):
     if isinstance(rvalue, UCRecordInitializerList):
-        __check_rvalue(lineno, rvalue.value[0])
-        __check_rvalue(lineno, rvalue.value[1])
+        __check_rvalue(ctx, lineno, rvalue.value[0])
+        __check_rvalue(ctx, lineno, rvalue.value[1])
     elif isinstance(rvalue, UCRecordDeref):
         if not isinstance(declarations[rvalue.lhs.id], UCRecord):
             errors.append((lineno, '`{}` is not a record'.format(rvalue.lhs.id)))
@@ -64,5 +74,5 @@ def __check_rvalue(lineno, rvalue):
     elif isinstance(rvalue, UCNumberLiteral):
         pass
     else:
-        __check_rvalue(lineno, rvalue.lhs)
-        __check_rvalue(lineno, rvalue.rhs)
+        __check_rvalue(ctx, lineno, rvalue.lhs)
+        __check_rvalue(ctx, lineno, rvalue.rhs)
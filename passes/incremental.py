@@ -0,0 +1,33 @@
+"""Incremental Re-analysis"""
+
+from .parse import parse
+from .cfg import UCProgramGraph
+from .analysis import *
+
+
+class UCIncrementalAnalyzer:
+    """Analyzes successive versions of a source. Each analysis starts from
+    its previous solution at the nodes unaffected by the changes, and only
+    the affected nodes are scheduled (see `UCAnalysis.reuse`)"""
+
+    def __init__(self, analyses=(UCReachingDefs, UCLiveVars,
+                                 UCDangerousVars, UCDetectionSigns)):
+        self.analyses = analyses
+        self.cfg = None
+        self.aas = [None] * len(analyses)
+
+    def update(self, src):
+        """Analyze a new version of the source, returning the computed
+        analyses in the order they were given"""
+        cfg = UCProgramGraph().compute(parse(src))
+        aas = []
+
+        for analysis, prev in zip(self.analyses, self.aas):
+            aa = analysis(cfg)
+            aa.compute(prev=prev)
+            aas.append(aa)
+
+        self.cfg = cfg
+        self.aas = aas
+
+        return aas
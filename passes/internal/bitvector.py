@@ -0,0 +1,64 @@
+"""Bit-vector Lattice Encoding"""
+
+
+class UCBitVector:
+    """Dense index of lattice elements, encoded as integer bit masks"""
+
+    def __init__(self, elems=None):
+        self.elems = []
+        self.index = {}
+
+        if elems is not None:
+            for e in elems:
+                self.add(e)
+
+    def add(self, e):
+        i = self.index.get(e)
+
+        if i is None:
+            i = len(self.elems)
+            self.index[e] = i
+            self.elems.append(e)
+
+        return i
+
+    def copy(self):
+        index = UCBitVector()
+        index.elems = self.elems.copy()
+        index.index = self.index.copy()
+
+        return index
+
+    def bit(self, e):
+        return 1 << self.index[e]
+
+    def encode(self, elems):
+        mask = 0
+
+        for e in elems:
+            mask |= 1 << self.index[e]
+
+        return mask
+
+    def decode(self, mask):
+        elems = set()
+
+        while mask:
+            low = mask & -mask
+            elems.add(self.elems[low.bit_length() - 1])
+            mask ^= low
+
+        return elems
+
+    @property
+    def full(self):
+        return (1 << len(self.elems)) - 1
+
+    def __len__(self):
+        return len(self.elems)
+
+    def __iter__(self):
+        return iter(self.elems)
+
+    def __contains__(self, e):
+        return e in self.index
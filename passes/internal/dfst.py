@@ -1,7 +1,5 @@
 """Spanning Tree Algorithms"""
 
-import networkx as nx
-
 
 class UCSpanTree:
     @staticmethod
@@ -9,27 +7,48 @@ class UCSpanTree:
         return dict(sorted(rp.items(), key=lambda x: x[1]))
 
     @staticmethod
-    def dfs_tree(cfg, source=None):
-        tree_nodes, tree_edges = set(), set()
+    def dfs(cfg, source=None, tree_edges=None):
+        """Depth-first search with an explicit stack. Returns the
+        reverse-postorder numbering and, if `tree_edges` is given, adds the
+        spanning tree edges to it"""
         rp = dict()
         k = len(cfg.nodes)
 
-        def dfs_visit(x):
-            nonlocal tree_nodes, tree_edges, rp, k
-
-            tree_nodes.add(x)
-
-            for y in cfg.successors(x):
-                if y not in tree_nodes:
-                    tree_edges.add((x, y,))
-                    dfs_visit(y)
-            
-            rp[x] = k
-            k -= 1
-        
         if source is None:
             source = cfg.source
-        
-        dfs_visit(source)
+
+        visited = {source}
+        stack = [(source, iter(cfg.successors(source)),)]
+
+        while stack:
+            x, x_post = stack[-1]
+
+            for y in x_post:
+                if y not in visited:
+                    visited.add(y)
+
+                    if tree_edges is not None:
+                        tree_edges.add((x, y,))
+
+                    stack.append((y, iter(cfg.successors(y)),))
+                    break
+            else:
+                stack.pop()
+
+                rp[x] = k
+                k -= 1
+
+        return rp
+
+    @staticmethod
+    def dfs_rp(cfg, source=None):
+        return UCSpanTree.dfs(cfg, source)
+
+    @staticmethod
+    def dfs_tree(cfg, source=None):
+        import networkx as nx
+
+        tree_edges = set()
+        rp = UCSpanTree.dfs(cfg, source, tree_edges)
 
         return rp, nx.DiGraph(tree_edges)
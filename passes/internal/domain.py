@@ -0,0 +1,108 @@
+"""Abstract Domains"""
+
+from abc import abstractmethod
+
+
+class UCAbstractDomain:
+    """Abstract domain of an analysis: a lattice of abstract values and the
+    transfer function of the edges. The worklist solvers join the transfer of
+    each edge into the assignment of its target (see `update`)"""
+
+    @abstractmethod
+    def bottom(self):
+        raise NotImplementedError()
+
+    @abstractmethod
+    def join(self, x, y):
+        raise NotImplementedError()
+
+    @abstractmethod
+    def leq(self, x, y):
+        raise NotImplementedError()
+
+    def widen(self, x, y):
+        """Widening of `x` by `y`, applied in place of the join at loop
+        heads. Domains of infinite height override it, so that ascending
+        chains stabilize; by default it is the join"""
+        return self.join(x, y)
+
+    @property
+    def widens(self):
+        """Whether the domain has a widening other than the join"""
+        return type(self).widen is not UCAbstractDomain.widen
+
+    @abstractmethod
+    def transfer(self, R, u, v, e=None):
+        """Abstract value flowing along the edge (u, v), of id `e` on frozen
+        graphs, under the assignment `R`, or None if there is none"""
+        raise NotImplementedError()
+
+    def update(self, R, u, v, e=None):
+        """Join the transfer of the edge (u, v) into the assignment of `v`,
+        returning whether it changed"""
+        r_uv = self.transfer(R, u, v, e)
+
+        if r_uv is None or self.leq(r_uv, R[v]):
+            return False
+
+        R[v] = self.join(R[v], r_uv)
+
+        return True
+
+    def update_widen(self, R, u, v, e=None):
+        """`update`, widening the assignment of `v` rather than joining"""
+        r_uv = self.transfer(R, u, v, e)
+
+        if r_uv is None or self.leq(r_uv, R[v]):
+            return False
+
+        R[v] = self.widen(R[v], r_uv)
+
+        return True
+
+    def analysis_fn(self, cfg):
+        """Analysis function `af(R, u, v, e=None)` solving the domain over
+        `cfg`"""
+        return self.update
+
+
+class UCPowersetDomain(UCAbstractDomain):
+    """Powerset lattice, with the transfer function `transfer`"""
+
+    def __init__(self, transfer):
+        self.transfer = transfer
+
+    def bottom(self):
+        return set()
+
+    def join(self, x, y):
+        return x | y
+
+    def leq(self, x, y):
+        return x <= y
+
+
+class UCBitVectorDomain(UCAbstractDomain):
+    """Powerset lattice encoded as bit masks, with the transfer function
+    `transfer`"""
+
+    def __init__(self, transfer):
+        self.transfer = transfer
+
+    def bottom(self):
+        return 0
+
+    def join(self, x, y):
+        return x | y
+
+    def leq(self, x, y):
+        return x & ~y == 0
+
+    def update(self, R, u, v, e=None):
+        r_uv = self.transfer(R, u, v, e)
+
+        if r_uv is not None and r_uv & ~R[v]:
+            R[v] |= r_uv
+            return True
+
+        return False
@@ -0,0 +1,132 @@
+"""Sign and Boolean Lattice Encoding"""
+
+from lang.ops import *
+
+
+# Signs and truth values, as the bits of 3-bit and 2-bit masks
+MINUS, ZERO, PLUS = 1, 2, 4
+TT, FF = 1, 2
+
+SIGNS = MINUS | ZERO | PLUS
+BOOLS = TT | FF
+
+SIGN_NAMES = {MINUS: '-', ZERO: '0', PLUS: '+'}
+BOOL_NAMES = {TT: 'tt', FF: 'ff'}
+
+
+def bits(mask, width=3):
+    """Single-bit masks set in `mask`"""
+    return [b for b in (1 << i for i in range(width)) if mask & b]
+
+
+def sign_names(mask):
+    """Set of sign names of `mask`"""
+    return {SIGN_NAMES[s] for s in bits(mask)}
+
+
+def bool_names(mask):
+    """Set of truth value names of `mask`"""
+    return {BOOL_NAMES[b] for b in bits(mask, 2)}
+
+
+def sign_of(value):
+    return MINUS if value < 0 else (ZERO if value == 0 else PLUS)
+
+
+def _table(op, width=3):
+    """Lookup table of the abstract operator over sign (or truth value) masks,
+    indexed by `m1 << width | m2`, from the operator `op` over single signs.
+    The result is the union over the pairs of signs of the operands"""
+    t = []
+
+    for m1 in range(1 << width):
+        for m2 in range(1 << width):
+            r = 0
+
+            for s1 in bits(m1, width):
+                for s2 in bits(m2, width):
+                    r |= op(s1, s2)
+
+            t.append(r)
+
+    return t
+
+
+def _add(s1, s2):
+    if s1 | s2 == MINUS | PLUS:
+        return SIGNS
+    elif s1 == ZERO and s2 == ZERO:
+        return ZERO
+
+    return MINUS if MINUS in (s1, s2) else PLUS
+
+
+def _sub(s1, s2):
+    if s1 == s2 and s1 != ZERO:
+        return SIGNS
+
+    return _add(s1, {MINUS: PLUS, ZERO: ZERO, PLUS: MINUS}[s2])
+
+
+def _mul(s1, s2):
+    if ZERO in (s1, s2):
+        return ZERO
+
+    return PLUS if s1 == s2 else MINUS
+
+
+def _div(s1, s2):
+    # Division by zero has no value
+    return _mul(s1, s2) if s2 != ZERO else 0
+
+
+def _mod(s1, s2):
+    # The sign is the sign of the divisor, modulo zero has no value
+    return s2 if s2 != ZERO else 0
+
+
+def _cmp(tt, ff):
+    """Relational operator, true for the pairs of signs in `tt` and false for
+    those in `ff`, either otherwise"""
+    def cmp_impl(s1, s2):
+        if (s1, s2) in tt:
+            return TT
+        elif (s1, s2) in ff:
+            return FF
+
+        return BOOLS
+
+    return cmp_impl
+
+
+_LT = {(ZERO, PLUS), (MINUS, PLUS), (MINUS, ZERO)}
+_GT = {(s2, s1) for s1, s2 in _LT}
+_EQ = {(ZERO, ZERO)}
+_NEQ = {(s1, s2) for s1 in bits(SIGNS) for s2 in bits(SIGNS) if s1 != s2}
+
+# Lookup tables of the arithmetic operators, over sign masks
+SIGN_TABLES = {
+    UCAdd: _table(_add),
+    UCSub: _table(_sub),
+    UCMul: _table(_mul),
+    UCDiv: _table(_div),
+    UCMod: _table(_mod),
+}
+
+# Lookup tables of the relational operators, over sign masks
+REL_TABLES = {
+    UCEq: _table(_cmp(_EQ, _NEQ)),
+    UCNeq: _table(_cmp(_NEQ, _EQ)),
+    UCLt: _table(_cmp(_LT, _GT | _EQ)),
+    UCLte: _table(_cmp(_LT | _EQ, _GT)),
+    UCGt: _table(_cmp(_GT, _LT | _EQ)),
+    UCGte: _table(_cmp(_GT | _EQ, _LT)),
+}
+
+# Lookup tables of the boolean operators, over truth value masks
+BOOL_TABLES = {
+    UCAnd: _table(lambda b1, b2: TT if b1 == b2 == TT else FF, 2),
+    UCOr: _table(lambda b1, b2: TT if TT in (b1, b2) else FF, 2),
+}
+
+NOT_TABLE = [(m & TT) << 1 | (m & FF) >> 1 for m in range(1 << 2)]
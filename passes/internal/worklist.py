@@ -1,16 +1,16 @@
 """Worklist Algorithm"""
 
+import heapq
+
 from abc import abstractmethod
 from collections import deque
 
 from .dfst import UCSpanTree
+from .domain import UCAbstractDomain
 from lang.ops import *
-from passes.cfg import UCProgramGraph
 from utils.decorators import classproperty
 from utils.functools import apply
 
-import networkx as nx
-
 
 class UCWorklistStrategy:
     """Worklist Strategy"""
@@ -31,8 +31,13 @@ class UCWorklistStrategy:
     def extract(self):
         raise NotImplementedError()
 
+    def __len__(self):
+        return len(self._worklist)
+
     @classproperty
     def node_ordering_fn(cls):
+        import networkx as nx
+
         return nx.dfs_preorder_nodes
 
 
@@ -72,38 +77,81 @@ class UCRRStrategy(UCWorklistStrategy):
     def __init__(self, ucw, cfg):
         super().__init__(ucw, cfg)
         self._worklist = [deque(self._worklist), set()]
+        self._current = set()
+        self._pending = []
+        self._rp = cfg.rp
 
     def insert(self, x):
-        if x is not None and x not in self._worklist[0]:
+        # Nodes unreachable from the source are never scheduled
+        if x is None or x not in self._rp:
+            return
+
+        if x not in self._current and x not in self._worklist[1]:
             self._worklist[1].add(x)
+            heapq.heappush(self._pending, (self._rp[x], x,))
 
     def extract(self):
         if len(self._worklist[0]) == 0:
-            rp, _ = UCSpanTree.dfs_tree(self._cfg)
-            
-            for x in self._cfg.nodes:
-                if x not in self._worklist[1]:
-                    rp.pop(x)
+            # Start a new round over the pending nodes, in reverse postorder
+            pending = self._pending
+            self._worklist[0] = deque(
+                heapq.heappop(pending)[1] for _ in range(len(pending)))
+            self._current = self._worklist[1]
+            self._worklist[1] = set()
 
-            rp = UCSpanTree.sort_rp(rp)
+        x = self._worklist[0].popleft()
+        self._current.discard(x)
 
-            self._worklist[0] = deque(rp.keys())
-            self._worklist[1] = set()
+        return x
 
-        return self._worklist[0].popleft()
+    def __len__(self):
+        return len(self._worklist[0]) + len(self._worklist[1])
 
     @classproperty
     def node_ordering_fn(cls):
         return lambda cfg, source:\
-                UCSpanTree.sort_rp(UCSpanTree.dfs_tree(cfg, source)[0]).keys()
+                UCSpanTree.sort_rp(cfg.rp if source == cfg.source else
+                                   UCSpanTree.dfs_rp(cfg, source)).keys()
+
+
+class UCPriorityStrategy(UCWorklistStrategy):
+    """Priority Queue Strategy, keyed by reverse postorder"""
+
+    def __init__(self, ucw, cfg):
+        super().__init__(ucw, cfg)
+        self._queued = set()
+        self._rp = cfg.rp
+
+    def insert(self, x):
+        # Nodes unreachable from the source are never scheduled
+        if x is None or x not in self._rp or x in self._queued:
+            return
+
+        self._queued.add(x)
+        heapq.heappush(self._worklist, (self._rp[x], x,))
+
+    def extract(self):
+        _, x = heapq.heappop(self._worklist)
+        self._queued.discard(x)
+
+        return x
+
+    @classproperty
+    def node_ordering_fn(cls):
+        return UCRRStrategy.node_ordering_fn
 
 
 class UCWorklist:
-    """Worklist Algorithm"""
+    """Worklist Algorithm, over an analysis function `af(R, u, v)`, which
+    updates the assignment `R` of `v` from the edge (u, v) and returns
+    whether it changed, or over an abstract domain (see `UCAbstractDomain`)"""
 
-    def __init__(self, cfg, af, r, strategy=UCLIFOStrategy):
+    # Whether the solver runs on frozen program graphs
+    frozen = False
+
+    def __init__(self, cfg, af, r, strategy=UCLIFOStrategy, seed=None):
         self.cfg = cfg
-        self.af = af
+        self.af = UCWorklist.analysis_fn(cfg, af)
         self.r = r
         self.strategy_type = strategy
         self.strategy = strategy(self, cfg)
@@ -113,12 +161,35 @@ class UCWorklist:
         # since it now has access to the CFG
         if cfg.source is not None:
             for q in strategy.node_ordering_fn(cfg, source=cfg.source):
-                self.strategy.insert(q)
+                # Only the seed nodes, if any, are scheduled initially
+                if seed is None or q in seed:
+                    self.strategy.insert(q)
+
+    @staticmethod
+    def analysis_fn(cfg, af):
+        """Analysis function `af`, or the one solving the abstract domain
+        `af` over `cfg`. Domains with a widening are widened at the loop
+        heads, the targets of the back edges"""
+        if not isinstance(af, UCAbstractDomain):
+            return af
+        elif not af.widens:
+            return af.analysis_fn(cfg)
+
+        rp = cfg.rp
+        update, update_widen = af.analysis_fn(cfg), af.update_widen
+
+        def analysis_fn_impl(R, u, v, e=None):
+            # Back edges do not lead forward in reverse postorder
+            if rp[v] <= rp[u]:
+                return update_widen(R, u, v, e)
+
+            return update(R, u, v, e)
+
+        return analysis_fn_impl
 
     @property
     def empty(self):
-        return UCWorklist(UCProgramGraph.empty,
-                            lambda _: set(), dict(), self.strategy_type)
+        return len(self.strategy) == 0
 
     def insert(self, x):
         self.strategy.insert(x)
@@ -129,7 +200,7 @@ class UCWorklist:
     def compute(self):
         iters = 0
 
-        while self != self.empty:
+        while not self.empty:
             w_update_set = set()
 
             u = self.extract()
@@ -145,7 +216,118 @@ class UCWorklist:
 
         return iters
 
+    def __len__(self):
+        return len(self.strategy)
+
     def __eq__(self, other):
         if isinstance(other, UCWorklist):
             return self.worklist == other.worklist
         return False
+
+
+class UCSCCWorklist(UCWorklist):
+    """Worklist Algorithm scheduled over strongly connected components
+
+    The components are solved one at a time in topological order, so nodes
+    outside of loops are visited exactly once. The number of iterations
+    spent in each component, keyed by its nodes, is kept in `scc_iters`.
+    """
+
+    def __init__(self, cfg, af, r, strategy=UCLIFOStrategy, seed=None):
+        # Nodes are scheduled one component at a time, by `compute`
+        super().__init__(cfg, af, r, strategy, seed=())
+
+        self.sccs = UCSCCWorklist.components(cfg)
+        self.seed = set(seed) if seed is not None else None
+        self.scc_iters = {}
+
+    @staticmethod
+    def components(cfg):
+        """Components reachable from the source, in topological order, each
+        with its nodes in reverse postorder"""
+        import networkx as nx
+
+        rp = cfg.rp
+        dag = nx.condensation(cfg)
+        sccs = []
+
+        for c in nx.topological_sort(dag):
+            scc = [x for x in dag.nodes[c]['members'] if x in rp]
+
+            if len(scc) > 0:
+                sccs.append(tuple(sorted(scc, key=rp.get)))
+
+        return sccs
+
+    def compute(self):
+        iters = 0
+
+        for scc in self.sccs:
+            scc_nodes = set(scc)
+
+            self.strategy = self.strategy_type(self, self.cfg)
+            self.worklist = self.strategy._worklist
+
+            apply(self.insert, [x for x in scc
+                                if self.seed is None or x in self.seed])
+
+            scc_iters = 0
+
+            while not self.empty:
+                w_update_set = set()
+
+                u = self.extract()
+                u_post = self.cfg.successors(u)
+
+                # Successors in later components are updated, but only
+                # scheduled once their own component is solved
+                for v in u_post:
+                    if self.af(self.r, u, v):
+                        if v in scc_nodes:
+                            w_update_set.add(v)
+                        elif self.seed is not None:
+                            self.seed.add(v)
+
+                apply(self.insert, w_update_set)
+
+                scc_iters += 1
+
+            self.scc_iters[scc] = scc_iters
+            iters += scc_iters
+
+        return iters
+
+
+class UCFrozenWorklist(UCWorklist):
+    """Worklist Algorithm over a frozen (array-backed) program graph
+
+    The assignment is indexed by node id, and the analysis function is
+    called with the id of the edge as well, `af(R, u, v, e)`.
+    """
+
+    frozen = True
+
+    def compute(self):
+        succ_offsets = self.cfg.succ_offsets
+        succ = self.cfg.succ
+        af, r = self.af, self.r
+        strategy = self.strategy
+        iters = 0
+
+        while len(strategy) > 0:
+            w_update_set = set()
+
+            u = strategy.extract()
+
+            for e in range(succ_offsets[u], succ_offsets[u + 1]):
+                v = succ[e]
+
+                if af(r, u, v, e):
+                    w_update_set.add(v)
+
+            for v in w_update_set:
+                strategy.insert(v)
+
+            iters += 1
+
+        return iters
@@ -1,5 +1,6 @@
 """TODO: Use lexer from lang.lex"""
-import ply.lex as lex
+import copy
+import threading
 
 from lang.types import *
 from lang.ops import *
@@ -107,7 +108,6 @@ def find_column(input, t):
 
 
 start = 'program'
-lexer = lex.lex()
 
 
 precedence = (
@@ -174,8 +174,9 @@ def p_var_declaration(p):
                        | INT SND'''
     p[0] = UCVariable(p[1], UCIdentifier(p[2]))
 
-    check_redeclaration(p.lineno(0), p[2])
-    declarations[p[2]] = p[0]
+    ctx = p.lexer.context
+    check_redeclaration(ctx, p.lineno(0), p[2])
+    ctx.declarations[p[2]] = p[0]
 
 
 def p_record_field_declaration(p):
@@ -188,16 +189,18 @@ def p_array_var_declaration(p):
     '''array_var_declaration : INT LBRACKET NUM_LITERAL RBRACKET IDENTIFIER'''
     p[0] = UCArray(p[1], UCIdentifier(p[5]), UCNumberLiteral(p[3]))
 
-    check_redeclaration(p.lineno(0), p[5])
-    declarations[p[5]] = p[0]
+    ctx = p.lexer.context
+    check_redeclaration(ctx, p.lineno(0), p[5])
+    ctx.declarations[p[5]] = p[0]
 
 
 def p_record_var_declaration(p):
     '''record_var_declaration : LBRACE record_field_declaration SEMICOLON record_field_declaration RBRACE IDENTIFIER'''
     p[0] = UCRecord('record', UCIdentifier(p[6]), [p[2], p[4]])
 
-    check_redeclaration(p.lineno(0), p[6])
-    declarations[p[6]] = p[0]
+    ctx = p.lexer.context
+    check_redeclaration(ctx, p.lineno(0), p[6])
+    ctx.declarations[p[6]] = p[0]
 
 # Statements
 def p_statements(p):
@@ -223,7 +226,7 @@ def p_statement(p):
 def p_assignment_statement(p):
     '''assignment_statement : lvalue EQQ a_expression'''
     p[0] = UCAssignment(p[1], p[3])
-    check_semantics(p.lineno(0), p[0])
+    check_semantics(p.lexer.context, p.lineno(0), p[0])
 
 
 def p_if_statement(p):
@@ -257,26 +260,28 @@ def p_lvalue(p):
 
 def p_id_lvalue(p):
     '''id_lvalue : IDENTIFIER'''
-    p[0] = declarations[p[1]].id
+    p[0] = p.lexer.context.declarations[p[1]].id
 
 
 def p_fst_lvalue(p):
     '''fst_lvalue : IDENTIFIER DOT FST'''
     # p[0] = declarations[p[1]].value['fst']
-    p[0] = UCRecordDeref(declarations[p[1]].id, UCIdentifier(p[3]))
+    p[0] = UCRecordDeref(p.lexer.context.declarations[p[1]].id,
+                         UCIdentifier(p[3]))
 
 
 def p_snd_lvalue(p):
     '''snd_lvalue : IDENTIFIER DOT SND'''
     # p[0] = declarations[p[1]].value['snd']
-    p[0] = UCRecordDeref(declarations[p[1]].id, UCIdentifier(p[3]))
+    p[0] = UCRecordDeref(p.lexer.context.declarations[p[1]].id,
+                         UCIdentifier(p[3]))
 
 
 def p_arr_var_lvalue(p):
     '''arr_var_lvalue : IDENTIFIER LBRACKET a_expression RBRACKET
     '''
     # p[0] = declarations[p[1]].value[int(p[3])]
-    p[0] = UCArrayDeref(declarations[p[1]].id, p[3])
+    p[0] = UCArrayDeref(p.lexer.context.declarations[p[1]].id, p[3])
 
 
 def p_rvalue(p):
@@ -401,27 +406,102 @@ def p_b_expression_unpacked(p):
 
 
 def p_error(t):
-    # TODO: Append the error to errors and handle them in `parse`
-    global src
-    print("Syntax error at '%s' - Line %d, Column %d" %
-          (t.value, lexer.lineno, find_column(src, t)))
+    # At the end of input, the parse fails and `parse` reports it
+    if t is None:
+        return
 
+    ctx = t.lexer.context
+    ctx.errors.append((t.lineno, 'syntax error at `{}`, column {}'.format(
+        t.value, find_column(ctx.src, t))))
 
-def parse(uc_src):
+
+class UCParseContext:
+    """Per-call parser state, reachable from the grammar rules through the
+    lexer (`p.lexer.context`)"""
+
+    def __init__(self, src):
+        self.src = src
+        self.declarations = {}
+        self.errors = []
+
+        # Lexer sharing the master lexer's tables, with its own position
+        self.lexer = get_lexer().clone()
+        self.lexer.lineno = 1
+        self.lexer.context = self
+
+
+# Master lexer and LALR parser singletons, see `get_lexer` and `get_parser`
+lexer = None
+parser = None
+parser_lock = threading.Lock()
+
+
+def get_lexer():
+    """Build the master lexer on first use"""
+    import ply.lex as lex
+
+    global lexer
+
+    with parser_lock:
+        if lexer is None:
+            lexer = lex.lex()
+
+    return lexer
+
+
+def get_parser():
+    """Build the parser once, from the tables prebuilt into `passes.parsetab`.
+    If the tables are stale, they are regenerated in memory only"""
     import ply.yacc as yacc
 
-    global src
+    global parser
+
+    with parser_lock:
+        if parser is None:
+            parser = yacc.yacc(tabmodule='parsetab', debug=False,
+                               write_tables=False)
+
+    return parser
+
 
-    parser = yacc.yacc()
+def build_tables():
+    """Regenerate `passes/parsetab.py` after the grammar is changed"""
+    import os
+    import ply.yacc as yacc
+
+    yacc.yacc(tabmodule='parsetab', outputdir=os.path.dirname(__file__),
+              debug=False, write_tables=True)
 
-    src = uc_src
-    ast = parser.parse(src, tracking=True)
 
-    # If there is any semantic error
-    if errors:
-        print("Errors:")
-        for error in errors:
-            print("\tIn line {}: {}".format(error[0], error[1]))
-        exit(1)
+def parse(uc_src):
+    """Parse a Micro-C source, raising UCParseError on syntax or semantic
+    errors. Safe to call concurrently: the parse stack and the parser state are private
+    to each call"""
+    ctx = UCParseContext(uc_src)
+
+    # The parse tables are shared, the parse stack is per-copy
+    parser = copy.copy(get_parser())
+    try:
+        ast = parser.parse(ctx.src, lexer=ctx.lexer, tracking=True)
+    except UCParseError as e:
+        raise UCParseError(ctx.errors + e.errors)
+    except Exception:
+        # The rules may fail on the partial trees of the error recovery,
+        # the syntax errors which caused them are reported instead
+        if not ctx.errors:
+            raise
+
+        ast = None
+
+    if ast is None and not ctx.errors:
+        ctx.errors.append((ctx.lexer.lineno, 'syntax error at end of input'))
+
+    # If there is any syntax or semantic error
+    if ctx.errors:
+        raise UCParseError(ctx.errors)
 
     return ast
+
+
+if __name__ == '__main__':
+    build_tables()
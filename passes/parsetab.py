@@ -0,0 +1,98 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'programleftORleftANDleftEQNEQleftLTGTLTEGTEleftPLUSMINUSleftMULTDIVMODrightNOTAND COMMA DIV DOT ELSE EQ EQQ FALSE FST GT GTE IDENTIFIER IF INT LBRACE LBRACKET LPAREN LT LTE MINUS MOD MULT NEQ NOT NUM_LITERAL OR PLUS RBRACE RBRACKET READ RPAREN SEMICOLON SND TRUE WHILE WRITEepsilon :program : block program\n               | epsilonblock : LBRACE declarations statements RBRACEnested_block : LBRACE statements RBRACEdeclarations : declaration SEMICOLON declarations\n                    | epsilondeclaration : var_declaration\n                   | array_var_declaration\n                   | record_var_declarationvar_declaration : INT IDENTIFIER\n                       | INT FST\n                       | INT SNDrecord_field_declaration : INT FST\n                                | INT SNDarray_var_declaration : INT LBRACKET NUM_LITERAL RBRACKET IDENTIFIERrecord_var_declaration : LBRACE record_field_declaration SEMICOLON record_field_declaration RBRACE IDENTIFIERstatements : statement statements\n                  | statementstatement : assignment_statement SEMICOLON\n                 | if_statement\n                 | if_else_statement\n                 | while_statement\n                 | call_statement SEMICOLONassignment_statement : lvalue EQQ a_expressionif_statement : IF LPAREN b_expression RPAREN nested_blockif_else_statement : IF LPAREN b_expression RPAREN nested_block ELSE nested_blockwhile_statement : WHILE LPAREN b_expression RPAREN nested_blockcall_statement : READ l_expression\n                      | WRITE a_expressionlvalue : id_lvalue\n              | fst_lvalue\n              | snd_lvalue\n              | arr_var_lvalueid_lvalue : IDENTIFIERfst_lvalue : IDENTIFIER DOT FSTsnd_lvalue : IDENTIFIER DOT SNDarr_var_lvalue : IDENTIFIER LBRACKET a_expression RBRACKET\n    rvalue : number_literal\n              | record_initializer_listnumber_literal : NUM_LITERALbool_literal : TRUE\n                    | FALSErecord_initializer_list : LPAREN a_expression COMMA a_expression RPARENl_expression : l_expression_unpacked\n                    | LPAREN l_expression_unpacked RPARENl_expression_unpacked : lvaluea_expression : a_expression_unpacked\n                    | l_expression\n                    | LPAREN a_expression_unpacked RPARENa_expression_unpacked : rvalue\n                             | a_expression PLUS a_expression\n                             | a_expression MINUS a_expression\n                             | a_expression MULT a_expression\n                             | a_expression DIV a_expression\n                             | a_expression MOD a_expressionb_expression : b_expression_unpacked\n                    | LPAREN b_expression_unpacked RPARENb_expression_unpacked : bool_literal\n                             | a_expression LT a_expression\n                             | a_expression GT a_expression\n                             | a_expression LTE a_expression\n                             | a_expression GTE a_expression\n                             | a_expression EQ a_expression\n                             | a_expression NEQ a_expression\n                             | b_expression AND b_expression\n                             | b_expression OR b_expression\n                             | NOT b_expression'
+    
+_lr_action_items = {'LBRACE':([0,2,4,33,41,93,103,129,],[4,4,6,6,-4,118,118,118,]),'$end':([0,1,2,3,5,41,],[-1,0,-1,-3,-2,-4,]),'IF':([4,7,9,17,19,20,21,33,43,44,62,117,118,127,132,133,],[-1,24,-7,24,-21,-22,-23,-1,-20,-24,-6,-26,24,-28,-27,-5,]),'WHILE':([4,7,9,17,19,20,21,33,43,44,62,117,118,127,132,133,],[-1,25,-7,25,-21,-22,-23,-1,-20,-24,-6,-26,25,-28,-27,-5,]),'READ':([4,7,9,17,19,20,21,33,43,44,62,117,118,127,132,133,],[-1,26,-7,26,-21,-22,-23,-1,-20,-24,-6,-26,26,-28,-27,-5,]),'WRITE':([4,7,9,17,19,20,21,33,43,44,62,117,118,127,132,133,],[-1,27,-7,27,-21,-22,-23,-1,-20,-24,-6,-26,27,-28,-27,-5,]),'IDENTIFIER':([4,7,9,13,17,19,20,21,26,27,33,43,44,45,46,47,50,55,61,62,66,71,76,77,78,79,80,87,88,89,94,95,96,97,98,99,100,101,111,117,118,127,132,133,],[-1,32,-7,34,32,-21,-22,-23,32,32,-1,-20,-24,32,32,32,32,32,32,-6,32,32,32,32,32,32,32,113,114,32,32,32,32,32,32,32,32,32,32,-26,32,-28,-27,-5,]),'INT':([4,6,33,38,],[13,15,13,15,]),'SEMICOLON':([8,10,11,12,14,18,22,28,29,30,31,32,34,35,36,39,40,48,49,51,52,53,54,56,57,58,59,65,84,85,104,105,106,107,108,109,110,112,113,114,131,],[33,-8,-9,-10,38,43,44,-31,-32,-33,-34,-35,-11,-12,-13,-14,-15,-29,-45,-47,-30,-48,-49,-51,-39,-40,-41,-25,-36,-37,-46,-52,-53,-54,-55,-56,-50,-38,-16,-17,-44,]),'FST':([13,15,60,],[35,39,84,]),'SND':([13,15,60,],[36,40,85,]),'LBRACKET':([13,32,],[37,61,]),'RBRACE':([16,17,19,20,21,39,40,42,43,44,64,117,127,130,132,133,],[41,-19,-21,-22,-23,-14,-15,-18,-20,-24,88,-26,-28,133,-27,-5,]),'EQQ':([23,28,29,30,31,32,84,85,112,],[45,-31,-32,-33,-34,-35,-36,-37,-38,]),'LPAREN':([24,25,26,27,45,46,47,55,61,66,71,76,77,78,79,80,89,94,95,96,97,98,99,100,101,111,],[46,47,50,55,55,66,66,55,55,89,66,55,55,55,55,55,89,66,66,55,55,55,55,55,55,55,]),'NUM_LITERAL':([27,37,45,46,47,55,61,66,71,76,77,78,79,80,89,94,95,96,97,98,99,100,101,111,],[59,63,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'PLUS':([28,29,30,31,32,49,51,52,53,54,56,57,58,59,65,70,81,82,83,84,85,86,91,104,105,106,107,108,109,110,112,115,121,122,123,124,125,126,128,131,],[-31,-32,-33,-34,-35,-45,-47,76,-48,-49,-51,-39,-40,-41,76,76,-48,-45,76,-36,-37,76,76,-46,-52,-53,-54,-55,-56,-50,-38,76,76,76,76,76,76,76,76,-44,]),'MINUS':([28,29,30,31,32,49,51,52,53,54,56,57,58,59,65,70,81,82,83,84,85,86,91,104,105,106,107,108,109,110,112,115,121,122,123,124,125,126,128,131,],[-31,-32,-33,-34,-35,-45,-47,77,-48,-49,-51,-39,-40,-41,77,77,-48,-45,77,-36,-37,77,77,-46,-52,-53,-54,-55,-56,-50,-38,77,77,77,77,77,77,77,77,-44,]),'MULT':([28,29,30,31,32,49,51,52,53,54,56,57,58,59,65,70,81,82,83,84,85,86,91,104,105,106,107,108,109,110,112,115,121,122,123,124,125,126,128,131,],[-31,-32,-33,-34,-35,-45,-47,78,-48,-49,-51,-39,-40,-41,78,78,-48,-45,78,-36,-37,78,78,-46,78,78,-54,-55,-56,-50,-38,78,78,78,78,78,78,78,78,-44,]),'DIV':([28,29,30,31,32,49,51,52,53,54,56,57,58,59,65,70,81,82,83,84,85,86,91,104,105,106,107,108,109,110,112,115,121,122,123,124,125,126,128,131,],[-31,-32,-33,-34,-35,-45,-47,79,-48,-49,-51,-39,-40,-41,79,79,-48,-45,79,-36,-37,79,79,-46,79,79,-54,-55,-56,-50,-38,79,79,79,79,79,79,79,79,-44,]),'MOD':([28,29,30,31,32,49,51,52,53,54,56,57,58,59,65,70,81,82,83,84,85,86,91,104,105,106,107,108,109,110,112,115,121,122,123,124,125,126,128,131,],[-31,-32,-33,-34,-35,-45,-47,80,-48,-49,-51,-39,-40,-41,80,80,-48,-45,80,-36,-37,80,80,-46,80,80,-54,-55,-56,-50,-38,80,80,80,80,80,80,80,80,-44,]),'LT':([28,29,30,31,32,49,51,53,54,56,57,58,59,70,81,82,84,85,91,104,105,106,107,108,109,110,112,115,131,],[-31,-32,-33,-34,-35,-45,-47,-48,-49,-51,-39,-40,-41,96,-48,-45,-36,-37,96,-46,-52,-53,-54,-55,-56,-50,-38,96,-44,]),'GT':([28,29,30,31,32,49,51,53,54,56,57,58,59,70,81,82,84,85,91,104,105,106,107,108,109,110,112,115,131,],[-31,-32,-33,-34,-35,-45,-47,-48,-49,-51,-39,-40,-41,97,-48,-45,-36,-37,97,-46,-52,-53,-54,-55,-56,-50,-38,97,-44,]),'LTE':([28,29,30,31,32,49,51,53,54,56,57,58,59,70,81,82,84,85,91,104,105,106,107,108,109,110,112,115,131,],[-31,-32,-33,-34,-35,-45,-47,-48,-49,-51,-39,-40,-41,98,-48,-45,-36,-37,98,-46,-52,-53,-54,-55,-56,-50,-38,98,-44,]),'GTE':([28,29,30,31,32,49,51,53,54,56,57,58,59,70,81,82,84,85,91,104,105,106,107,108,109,110,112,115,131,],[-31,-32,-33,-34,-35,-45,-47,-48,-49,-51,-39,-40,-41,99,-48,-45,-36,-37,99,-46,-52,-53,-54,-55,-56,-50,-38,99,-44,]),'EQ':([28,29,30,31,32,49,51,53,54,56,57,58,59,70,81,82,84,85,91,104,105,106,107,108,109,110,112,115,131,],[-31,-32,-33,-34,-35,-45,-47,-48,-49,-51,-39,-40,-41,100,-48,-45,-36,-37,100,-46,-52,-53,-54,-55,-56,-50,-38,100,-44,]),'NEQ':([28,29,30,31,32,49,51,53,54,56,57,58,59,70,81,82,84,85,91,104,105,106,107,108,109,110,112,115,131,],[-31,-32,-33,-34,-35,-45,-47,-48,-49,-51,-39,-40,-41,101,-48,-45,-36,-37,101,-46,-52,-53,-54,-55,-56,-50,-38,101,-44,]),'RPAREN':([28,29,30,31,32,49,51,53,54,56,57,58,59,67,68,69,72,73,74,75,81,82,84,85,90,102,104,105,106,107,108,109,110,112,116,119,120,121,122,123,124,125,126,128,131,],[-31,-32,-33,-34,-35,-45,-47,-48,-49,-51,-39,-40,-41,93,-57,-59,-42,-43,103,104,110,104,-36,-37,116,-68,-46,-52,-53,-54,-55,-56,-50,-38,-58,-66,-67,-60,-61,-62,-63,-64,-65,131,-44,]),'COMMA':([28,29,30,31,32,49,51,53,54,56,57,58,59,81,82,83,84,85,91,104,105,106,107,108,109,110,112,115,131,],[-31,-32,-33,-34,-35,-45,-47,-48,-49,-51,-39,-40,-41,-48,-45,111,-36,-37,111,-46,-52,-53,-54,-55,-56,-50,-38,111,-44,]),'RBRACKET':([28,29,30,31,32,49,51,53,54,56,57,58,59,63,84,85,86,104,105,106,107,108,109,110,112,131,],[-31,-32,-33,-34,-35,-45,-47,-48,-49,-51,-39,-40,-41,87,-36,-37,112,-46,-52,-53,-54,-55,-56,-50,-38,-44,]),'AND':([28,29,30,31,32,49,51,53,54,56,57,58,59,67,68,69,72,73,74,84,85,90,92,102,104,105,106,107,108,109,110,112,116,119,120,121,122,123,124,125,126,131,],[-31,-32,-33,-34,-35,-45,-47,-48,-49,-51,-39,-40,-41,94,-57,-59,-42,-43,94,-36,-37,-57,94,-68,-46,-52,-53,-54,-55,-56,-50,-38,-58,-66,94,-60,-61,-62,-63,-64,-65,-44,]),'OR':([28,29,30,31,32,49,51,53,54,56,57,58,59,67,68,69,72,73,74,84,85,90,92,102,104,105,106,107,108,109,110,112,116,119,120,121,122,123,124,125,126,131,],[-31,-32,-33,-34,-35,-45,-47,-48,-49,-51,-39,-40,-41,95,-57,-59,-42,-43,95,-36,-37,-57,95,-68,-46,-52,-53,-54,-55,-56,-50,-38,-58,-66,-67,-60,-61,-62,-63,-64,-65,-44,]),'DOT':([32,],[60,]),'NOT':([46,47,66,71,89,94,95,],[71,71,71,71,71,71,71,]),'TRUE':([46,47,66,71,89,94,95,],[72,72,72,72,72,72,72,]),'FALSE':([46,47,66,71,89,94,95,],[73,73,73,73,73,73,73,]),'ELSE':([117,133,],[129,-5,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,2,],[1,5,]),'block':([0,2,],[2,2,]),'epsilon':([0,2,4,33,],[3,3,9,9,]),'declarations':([4,33,],[7,62,]),'declaration':([4,33,],[8,8,]),'var_declaration':([4,33,],[10,10,]),'array_var_declaration':([4,33,],[11,11,]),'record_var_declaration':([4,33,],[12,12,]),'record_field_declaration':([6,38,],[14,64,]),'statements':([7,17,118,],[16,42,130,]),'statement':([7,17,118,],[17,17,17,]),'assignment_statement':([7,17,118,],[18,18,18,]),'if_statement':([7,17,118,],[19,19,19,]),'if_else_statement':([7,17,118,],[20,20,20,]),'while_statement':([7,17,118,],[21,21,21,]),'call_statement':([7,17,118,],[22,22,22,]),'lvalue':([7,17,26,27,45,46,47,50,55,61,66,71,76,77,78,79,80,89,94,95,96,97,98,99,100,101,111,118,],[23,23,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,23,]),'id_lvalue':([7,17,26,27,45,46,47,50,55,61,66,71,76,77,78,79,80,89,94,95,96,97,98,99,100,101,111,118,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'fst_lvalue':([7,17,26,27,45,46,47,50,55,61,66,71,76,77,78,79,80,89,94,95,96,97,98,99,100,101,111,118,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'snd_lvalue':([7,17,26,27,45,46,47,50,55,61,66,71,76,77,78,79,80,89,94,95,96,97,98,99,100,101,111,118,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'arr_var_lvalue':([7,17,26,27,45,46,47,50,55,61,66,71,76,77,78,79,80,89,94,95,96,97,98,99,100,101,111,118,],[31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'l_expression':([26,27,45,46,47,55,61,66,71,76,77,78,79,80,89,94,95,96,97,98,99,100,101,111,],[48,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,]),'l_expression_unpacked':([26,27,45,46,47,50,55,61,66,71,76,77,78,79,80,89,94,95,96,97,98,99,100,101,111,],[49,49,49,49,49,75,82,49,82,49,49,49,49,49,49,82,49,49,49,49,49,49,49,49,49,]),'a_expression':([27,45,46,47,55,61,66,71,76,77,78,79,80,89,94,95,96,97,98,99,100,101,111,],[52,65,70,70,83,86,91,70,105,106,107,108,109,115,70,70,121,122,123,124,125,126,128,]),'a_expression_unpacked':([27,45,46,47,55,61,66,71,76,77,78,79,80,89,94,95,96,97,98,99,100,101,111,],[53,53,53,53,81,53,81,53,53,53,53,53,53,81,53,53,53,53,53,53,53,53,53,]),'rvalue':([27,45,46,47,55,61,66,71,76,77,78,79,80,89,94,95,96,97,98,99,100,101,111,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'number_literal':([27,45,46,47,55,61,66,71,76,77,78,79,80,89,94,95,96,97,98,99,100,101,111,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'record_initializer_list':([27,45,46,47,55,61,66,71,76,77,78,79,80,89,94,95,96,97,98,99,100,101,111,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'b_expression':([46,47,66,71,89,94,95,],[67,74,92,102,92,119,120,]),'b_expression_unpacked':([46,47,66,71,89,94,95,],[68,68,90,68,90,68,68,]),'bool_literal':([46,47,66,71,89,94,95,],[69,69,69,69,69,69,69,]),'nested_block':([93,103,129,],[117,127,132,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('epsilon -> <empty>','epsilon',0,'p_epsilon','parse.py',126),
+  ('program -> block program','program',2,'p_program','parse.py',131),
+  ('program -> epsilon','program',1,'p_program','parse.py',132),
+  ('block -> LBRACE declarations statements RBRACE','block',4,'p_block','parse.py',141),
+  ('nested_block -> LBRACE statements RBRACE','nested_block',3,'p_nested_block','parse.py',148),
+  ('declarations -> declaration SEMICOLON declarations','declarations',3,'p_declarations','parse.py',154),
+  ('declarations -> epsilon','declarations',1,'p_declarations','parse.py',155),
+  ('declaration -> var_declaration','declaration',1,'p_declaration','parse.py',164),
+  ('declaration -> array_var_declaration','declaration',1,'p_declaration','parse.py',165),
+  ('declaration -> record_var_declaration','declaration',1,'p_declaration','parse.py',166),
+  ('var_declaration -> INT IDENTIFIER','var_declaration',2,'p_var_declaration','parse.py',172),
+  ('var_declaration -> INT FST','var_declaration',2,'p_var_declaration','parse.py',173),
+  ('var_declaration -> INT SND','var_declaration',2,'p_var_declaration','parse.py',174),
+  ('record_field_declaration -> INT FST','record_field_declaration',2,'p_record_field_declaration','parse.py',182),
+  ('record_field_declaration -> INT SND','record_field_declaration',2,'p_record_field_declaration','parse.py',183),
+  ('array_var_declaration -> INT LBRACKET NUM_LITERAL RBRACKET IDENTIFIER','array_var_declaration',5,'p_array_var_declaration','parse.py',188),
+  ('record_var_declaration -> LBRACE record_field_declaration SEMICOLON record_field_declaration RBRACE IDENTIFIER','record_var_declaration',6,'p_record_var_declaration','parse.py',196),
+  ('statements -> statement statements','statements',2,'p_statements','parse.py',204),
+  ('statements -> statement','statements',1,'p_statements','parse.py',205),
+  ('statement -> assignment_statement SEMICOLON','statement',2,'p_statement','parse.py',214),
+  ('statement -> if_statement','statement',1,'p_statement','parse.py',215),
+  ('statement -> if_else_statement','statement',1,'p_statement','parse.py',216),
+  ('statement -> while_statement','statement',1,'p_statement','parse.py',217),
+  ('statement -> call_statement SEMICOLON','statement',2,'p_statement','parse.py',218),
+  ('assignment_statement -> lvalue EQQ a_expression','assignment_statement',3,'p_assignment_statement','parse.py',224),
+  ('if_statement -> IF LPAREN b_expression RPAREN nested_block','if_statement',5,'p_if_statement','parse.py',230),
+  ('if_else_statement -> IF LPAREN b_expression RPAREN nested_block ELSE nested_block','if_else_statement',7,'p_if_else_statement','parse.py',235),
+  ('while_statement -> WHILE LPAREN b_expression RPAREN nested_block','while_statement',5,'p_while_statement','parse.py',240),
+  ('call_statement -> READ l_expression','call_statement',2,'p_call_statement','parse.py',245),
+  ('call_statement -> WRITE a_expression','call_statement',2,'p_call_statement','parse.py',246),
+  ('lvalue -> id_lvalue','lvalue',1,'p_lvalue','parse.py',251),
+  ('lvalue -> fst_lvalue','lvalue',1,'p_lvalue','parse.py',252),
+  ('lvalue -> snd_lvalue','lvalue',1,'p_lvalue','parse.py',253),
+  ('lvalue -> arr_var_lvalue','lvalue',1,'p_lvalue','parse.py',254),
+  ('id_lvalue -> IDENTIFIER','id_lvalue',1,'p_id_lvalue','parse.py',259),
+  ('fst_lvalue -> IDENTIFIER DOT FST','fst_lvalue',3,'p_fst_lvalue','parse.py',264),
+  ('snd_lvalue -> IDENTIFIER DOT SND','snd_lvalue',3,'p_snd_lvalue','parse.py',270),
+  ('arr_var_lvalue -> IDENTIFIER LBRACKET a_expression RBRACKET','arr_var_lvalue',4,'p_arr_var_lvalue','parse.py',276),
+  ('rvalue -> number_literal','rvalue',1,'p_rvalue','parse.py',283),
+  ('rvalue -> record_initializer_list','rvalue',1,'p_rvalue','parse.py',284),
+  ('number_literal -> NUM_LITERAL','number_literal',1,'p_number_literal','parse.py',289),
+  ('bool_literal -> TRUE','bool_literal',1,'p_bool_literal','parse.py',294),
+  ('bool_literal -> FALSE','bool_literal',1,'p_bool_literal','parse.py',295),
+  ('record_initializer_list -> LPAREN a_expression COMMA a_expression RPAREN','record_initializer_list',5,'p_record_initializer_list','parse.py',300),
+  ('l_expression -> l_expression_unpacked','l_expression',1,'p_l_expression','parse.py',305),
+  ('l_expression -> LPAREN l_expression_unpacked RPAREN','l_expression',3,'p_l_expression','parse.py',306),
+  ('l_expression_unpacked -> lvalue','l_expression_unpacked',1,'p_l_expression_unpacked','parse.py',316),
+  ('a_expression -> a_expression_unpacked','a_expression',1,'p_a_expression','parse.py',321),
+  ('a_expression -> l_expression','a_expression',1,'p_a_expression','parse.py',322),
+  ('a_expression -> LPAREN a_expression_unpacked RPAREN','a_expression',3,'p_a_expression','parse.py',323),
+  ('a_expression_unpacked -> rvalue','a_expression_unpacked',1,'p_a_expression_unpacked','parse.py',333),
+  ('a_expression_unpacked -> a_expression PLUS a_expression','a_expression_unpacked',3,'p_a_expression_unpacked','parse.py',334),
+  ('a_expression_unpacked -> a_expression MINUS a_expression','a_expression_unpacked',3,'p_a_expression_unpacked','parse.py',335),
+  ('a_expression_unpacked -> a_expression MULT a_expression','a_expression_unpacked',3,'p_a_expression_unpacked','parse.py',336),
+  ('a_expression_unpacked -> a_expression DIV a_expression','a_expression_unpacked',3,'p_a_expression_unpacked','parse.py',337),
+  ('a_expression_unpacked -> a_expression MOD a_expression','a_expression_unpacked',3,'p_a_expression_unpacked','parse.py',338),
+  ('b_expression -> b_expression_unpacked','b_expression',1,'p_b_expression','parse.py',357),
+  ('b_expression -> LPAREN b_expression_unpacked RPAREN','b_expression',3,'p_b_expression','parse.py',358),
+  ('b_expression_unpacked -> bool_literal','b_expression_unpacked',1,'p_b_expression_unpacked','parse.py',368),
+  ('b_expression_unpacked -> a_expression LT a_expression','b_expression_unpacked',3,'p_b_expression_unpacked','parse.py',369),
+  ('b_expression_unpacked -> a_expression GT a_expression','b_expression_unpacked',3,'p_b_expression_unpacked','parse.py',370),
+  ('b_expression_unpacked -> a_expression LTE a_expression','b_expression_unpacked',3,'p_b_expression_unpacked','parse.py',371),
+  ('b_expression_unpacked -> a_expression GTE a_expression','b_expression_unpacked',3,'p_b_expression_unpacked','parse.py',372),
+  ('b_expression_unpacked -> a_expression EQ a_expression','b_expression_unpacked',3,'p_b_expression_unpacked','parse.py',373),
+  ('b_expression_unpacked -> a_expression NEQ a_expression','b_expression_unpacked',3,'p_b_expression_unpacked','parse.py',374),
+  ('b_expression_unpacked -> b_expression AND b_expression','b_expression_unpacked',3,'p_b_expression_unpacked','parse.py',375),
+  ('b_expression_unpacked -> b_expression OR b_expression','b_expression_unpacked',3,'p_b_expression_unpacked','parse.py',376),
+  ('b_expression_unpacked -> NOT b_expression','b_expression_unpacked',2,'p_b_expression_unpacked','parse.py',377),
+]
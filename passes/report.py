@@ -0,0 +1,61 @@
+"""Micro-C JSON Lines Reports"""
+
+import json
+import sys
+
+from .checks import UCParseError
+
+
+def ast_records(ast):
+    """Generator over the records of the AST nodes, in preorder"""
+    for node, depth in ast.walk():
+        yield {
+            'kind': 'ast',
+            'depth': depth,
+            'key': str(node.key) if node.key is not None else None,
+            'types': [node_ty.__name__
+                      for node_ty in type(node).__mro__[:-2]],
+            'line': node.lineno
+        }
+
+
+def cfg_records(cfg):
+    """Generator over the records of the program graph nodes and edges"""
+    for q, q_data in cfg.nodes(data=True):
+        yield {'kind': 'node', 'node': q, 'type': q_data.get('type')}
+
+    for u, v, action in cfg.edges(data='action'):
+        yield {'kind': 'edge', 'source': u, 'target': v, 'action': str(action)}
+
+
+def analysis_records(aa, **extra):
+    """Generator over the records of a computed analysis: a header with the
+    iteration count, then one record per fact"""
+    name = type(aa).__name__
+
+    yield {'kind': 'analysis', 'analysis': name, 'iterations': aa.iters,
+           **extra}
+
+    for q, ae in aa.facts():
+        yield {'kind': 'fact', 'analysis': name, 'node': q,
+               'fact': aa.fact_record(ae), **extra}
+
+
+def write_jsonl(records, out=None):
+    """Write `records` to `out` (stdout by default), one JSON object per line"""
+    out = out if out is not None else sys.stdout
+
+    for record in records:
+        out.write(json.dumps(record, ensure_ascii=False))
+        out.write('\n')
+
+
+def error_records(e, **extra):
+    """Generator over the records of an error: one per error of a
+    UCParseError, with its line, or a single one otherwise"""
+    if isinstance(e, UCParseError):
+        for lineno, error in e.errors:
+            yield {'kind': 'error', 'line': lineno, 'error': error, **extra}
+    else:
+        yield {'kind': 'error', 'line': None,
+               'error': f'{type(e).__name__}: {e}', **extra}
@@ -0,0 +1,46 @@
+"""Parallel Scheduling of Independent Analyses"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+from .cfg import UCProgramGraph
+
+
+# Program graph of the worker process, set once by `init_worker`
+worker_cfg = None
+
+
+def init_worker(compact):
+    global worker_cfg
+
+    worker_cfg = UCProgramGraph.from_compact(compact)
+
+
+def compute_worker(analysis):
+    aa = analysis(worker_cfg)
+    aa.compute()
+
+    return aa.result
+
+
+class UCAnalysisScheduler:
+    """Runs analyses of the same program graph concurrently, in worker
+    processes. The graph is shipped once to each worker, in compact form"""
+
+    def __init__(self, cfg, analyses, jobs=None):
+        self.cfg = cfg
+        self.analyses = analyses
+        self.jobs = jobs if jobs is not None else len(analyses)
+
+    def compute(self):
+        """Returns the computed analyses, in the order they were given"""
+        aas = [analysis(self.cfg) for analysis in self.analyses]
+
+        with ProcessPoolExecutor(max_workers=self.jobs,
+                                 initializer=init_worker,
+                                 initargs=(self.cfg.to_compact(),)) as executor:
+            results = executor.map(compute_worker, self.analyses)
+
+            for aa, result in zip(aas, results):
+                aa.result = result
+
+        return aas
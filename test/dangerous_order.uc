@@ -0,0 +1,11 @@
+{
+    int x;
+    int y;
+    int[5] A;
+    if (x > 0) {
+        y := 1;
+    } else {
+        A[0] := x;
+    }
+    write y;
+}
@@ -0,0 +1,14 @@
+{
+    int a;
+    int d;
+    int x;
+    int y;
+    int[5] A;
+    a := 7;
+    x := 0 - a / d;
+    y := a % d;
+    d := 0 - 1;
+    A[d] := a;
+    x := A[d];
+    y := a / d;
+}
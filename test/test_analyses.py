@@ -0,0 +1,110 @@
+"""Equivalence checks of the analyses, run with `python -m pytest test`
+
+Every solver, strategy and backend, and the incremental re-analysis, must
+give the same solution as a full analysis with the default solver, on
+every program of `test/`.
+"""
+
+import glob
+import os
+
+import pytest
+
+from passes.parse import *
+from passes.cfg import UCProgramGraph
+from passes.analysis import *
+from passes.incremental import UCIncrementalAnalyzer
+from passes.internal.worklist import *
+
+
+ANALYSES = (UCReachingDefs, UCLiveVars, UCDangerousVars, UCDetectionSigns)
+SOLVERS = (UCWorklist, UCSCCWorklist, UCFrozenWorklist)
+STRATEGIES = (UCFIFOStrategy, UCLIFOStrategy, UCRRStrategy, UCPriorityStrategy)
+
+SOURCES = sorted(glob.glob(os.path.join(os.path.dirname(__file__), '*.uc')))
+
+
+def load(path):
+    with open(path, 'r') as f:
+        src = f.read()
+
+    try:
+        parse(src)
+    except UCParseError:
+        pytest.skip(f'{os.path.basename(path)} does not parse')
+
+    return src
+
+
+def solution(aa):
+    """Assignments of `aa`, comparable across runs and backends"""
+    def fact(ae):
+        if isinstance(ae, dict):
+            return sorted((str(x), sorted(s)) for x, s in ae.items())
+
+        return sorted(map(str, ae))
+
+    return {q: fact(ae) for q, ae in aa.aa.items()}
+
+
+def backends(analysis):
+    """Keyword arguments selecting each backend of `analysis`"""
+    if analysis is UCDetectionSigns:
+        return [{}]
+
+    return [{'bitvector': True}, {'bitvector': False}]
+
+
+def edits(src):
+    """Versions of `src` without one of its assignments, which parse"""
+    lines = src.split('\n')
+
+    for i, line in enumerate(lines):
+        if ':=' not in line or line.count(';') != 1:
+            continue
+
+        src_ = '\n'.join(lines[:i] + lines[i + 1:])
+
+        try:
+            parse(src_)
+        except Exception:
+            continue
+
+        yield src_
+
+
+@pytest.mark.parametrize('path', SOURCES, ids=os.path.basename)
+def test_solvers_agree(path):
+    cfg = UCProgramGraph().compute(parse(load(path)))
+
+    for analysis in ANALYSES:
+        expected = analysis(cfg)
+        expected.compute()
+
+        for kw in backends(analysis):
+            for solver in SOLVERS:
+                for strategy in STRATEGIES:
+                    aa = analysis(cfg, solver=solver, strategy=strategy, **kw)
+                    aa.compute()
+
+                    assert solution(aa) == solution(expected), \
+                        (analysis.__name__, kw, solver.__name__,
+                         strategy.__name__)
+
+
+@pytest.mark.parametrize('path', SOURCES, ids=os.path.basename)
+def test_incremental_matches_full(path):
+    src = load(path)
+
+    for src_ in edits(src):
+        # Re-analyze the source after removing an assignment, and back
+        for before, after in ((src, src_), (src_, src)):
+            analyzer = UCIncrementalAnalyzer()
+            analyzer.update(before)
+
+            for aa in analyzer.update(after):
+                expected = type(aa)(analyzer.cfg)
+                expected.compute()
+
+                assert solution(aa) == solution(expected), \
+                    type(aa).__name__
@@ -0,0 +1,66 @@
+"""Abstract domain protocol checks, run with `python -m pytest test`"""
+
+import math
+
+from lang.types import *
+from lang.ops import *
+from passes.parse import parse
+from passes.cfg import UCProgramGraph
+from passes.internal.domain import *
+from passes.internal.worklist import *
+
+
+class UCUpperBoundDomain(UCAbstractDomain):
+    """Upper bound of the value of `i`, a lattice of infinite height: the
+    ascending chains of `i := i + 1` in a loop only stabilize by widening"""
+
+    def __init__(self, cfg):
+        self.actions = {(u, v): a for u, v, a in cfg.edges(data='action')}
+        self.widenings = 0
+
+    def bottom(self):
+        return -math.inf
+
+    def join(self, x, y):
+        return max(x, y)
+
+    def leq(self, x, y):
+        return x <= y
+
+    def widen(self, x, y):
+        self.widenings += 1
+        return x if y <= x else math.inf
+
+    def transfer(self, R, u, v, e=None):
+        a = self.actions[u, v]
+
+        if isinstance(a, UCAssignment) and isinstance(a.rhs, UCAdd):
+            return R[u] + a.rhs.rhs.value
+        elif isinstance(a, UCAssignment):
+            return a.rhs.value
+
+        return R[u]
+
+
+def test_widen_at_loop_heads():
+    cfg = UCProgramGraph().compute(parse(
+        '{ int i; i := 0; while (i < 10) { i := i + 1; } write i; }'))
+
+    for solver in (UCWorklist, UCSCCWorklist):
+        for strategy in (UCFIFOStrategy, UCLIFOStrategy, UCRRStrategy,
+                         UCPriorityStrategy):
+            domain = UCUpperBoundDomain(cfg)
+            R = {q: domain.bottom() for q in cfg.nodes}
+            R[cfg.source] = 0
+
+            solver(cfg, domain, R, strategy=strategy).compute()
+
+            assert domain.widenings > 0
+            assert R[cfg.sink] == math.inf
+
+
+def test_join_by_default():
+    domain = UCPowersetDomain(None)
+
+    assert not domain.widens
+    assert domain.widen({1}, {2}) == {1, 2}